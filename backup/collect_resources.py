@@ -105,6 +105,35 @@ class XIBStoryboardParser:
         return True
 
 
+def _add_plist_string(value_elem, result: defaultdict, category: str) -> bool:
+    """<string> 값을 category에 추가 (값 태그가 다르면 False)"""
+    if value_elem.tag != 'string':
+        return False
+    if value_elem.text:
+        result[category].add(value_elem.text)
+    return True
+
+
+def _add_plist_array_strings(value_elem, result: defaultdict, category: str) -> bool:
+    """<array>의 <string> 항목들을 category에 추가 (값 태그가 다르면 False)"""
+    if value_elem.tag != 'array':
+        return False
+    for string_elem in value_elem.findall('string'):
+        if string_elem.text:
+            result[category].add(string_elem.text)
+    return True
+
+
+# XML plist 키 → (값 처리 함수, 결과 카테고리)
+_PLIST_KEY_HANDLERS = {
+    'CFBundleURLSchemes': (_add_plist_array_strings, 'url_schemes'),
+    'CFBundleTypeName': (_add_plist_string, 'document_types'),
+    'UTTypeIdentifier': (_add_plist_string, 'uti_identifiers'),
+    'NSUserActivityTypes': (_add_plist_array_strings, 'user_activity_types'),
+    'BGTaskSchedulerPermittedIdentifiers': (_add_plist_array_strings, 'background_task_ids'),
+}
+
+
 class PlistParser:
     """Plist 파일에서 식별자 추출 (바이너리/XML 자동 처리)"""
 
@@ -118,7 +147,7 @@ class PlistParser:
                 plist_data = plistlib.load(f)
 
             if isinstance(plist_data, dict):
-                cls._parse_dict_native(plist_data, result, [])
+                cls._parse_dict_native(plist_data, result)
                 return dict(result)
         except Exception:
             pass
@@ -129,91 +158,73 @@ class PlistParser:
             root = tree.getroot()
             main_dict = root.find('dict')
             if main_dict is not None:
-                cls._parse_dict_xml(main_dict, result, [])
+                cls._parse_dict_xml(main_dict, result)
         except Exception:
             pass
 
         return dict(result)
 
     @classmethod
-    def _parse_dict_native(cls, data: dict, result: defaultdict, key_path: List[str]):
-        """Python dict로 파싱"""
-        for key, value in data.items():
-            if key == 'CFBundleURLSchemes' and isinstance(value, list):
-                for item in value:
-                    if isinstance(item, str):
-                        result['url_schemes'].add(item)
-
-            elif key == 'CFBundleTypeName' and isinstance(value, str):
-                result['document_types'].add(value)
-
-            elif key == 'UTTypeIdentifier' and isinstance(value, str):
-                result['uti_identifiers'].add(value)
-
-            elif key == 'NSUserActivityTypes' and isinstance(value, list):
-                for item in value:
-                    if isinstance(item, str):
-                        result['user_activity_types'].add(item)
-
-            elif key == 'BGTaskSchedulerPermittedIdentifiers' and isinstance(value, list):
-                for item in value:
-                    if isinstance(item, str):
-                        result['background_task_ids'].add(item)
-
-            elif isinstance(value, dict):
-                cls._parse_dict_native(value, result, key_path + [key])
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        cls._parse_dict_native(item, result, key_path + [key])
+    def _parse_dict_native(cls, data: dict, result: defaultdict):
+        """Python dict로 파싱 (중첩 dict는 재귀 대신 스택으로 순회)"""
+        stack = [data]
+
+        while stack:
+            for key, value in stack.pop().items():
+                if key == 'CFBundleURLSchemes' and isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, str):
+                            result['url_schemes'].add(item)
+
+                elif key == 'CFBundleTypeName' and isinstance(value, str):
+                    result['document_types'].add(value)
+
+                elif key == 'UTTypeIdentifier' and isinstance(value, str):
+                    result['uti_identifiers'].add(value)
+
+                elif key == 'NSUserActivityTypes' and isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, str):
+                            result['user_activity_types'].add(item)
+
+                elif key == 'BGTaskSchedulerPermittedIdentifiers' and isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, str):
+                            result['background_task_ids'].add(item)
+
+                elif isinstance(value, dict):
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.extend(item for item in value if isinstance(item, dict))
 
     @classmethod
-    def _parse_dict_xml(cls, dict_elem, result: defaultdict, key_path: List[str]):
-        """XML로 파싱"""
-        children = list(dict_elem)
-        i = 0
-
-        while i < len(children):
-            if children[i].tag == 'key':
-                key = children[i].text
-                if i + 1 < len(children):
-                    value_elem = children[i + 1]
-
-                    if key == 'CFBundleURLSchemes' and value_elem.tag == 'array':
-                        for string_elem in value_elem.findall('string'):
-                            if string_elem.text:
-                                result['url_schemes'].add(string_elem.text)
-
-                    elif key == 'CFBundleTypeName' and value_elem.tag == 'string':
-                        if value_elem.text:
-                            result['document_types'].add(value_elem.text)
-
-                    elif key == 'UTTypeIdentifier' and value_elem.tag == 'string':
-                        if value_elem.text:
-                            result['uti_identifiers'].add(value_elem.text)
-
-                    elif key == 'NSUserActivityTypes' and value_elem.tag == 'array':
-                        for string_elem in value_elem.findall('string'):
-                            if string_elem.text:
-                                result['user_activity_types'].add(string_elem.text)
-
-                    elif key == 'BGTaskSchedulerPermittedIdentifiers' and value_elem.tag == 'array':
-                        for string_elem in value_elem.findall('string'):
-                            if string_elem.text:
-                                result['background_task_ids'].add(string_elem.text)
-
-                    elif value_elem.tag == 'dict':
-                        cls._parse_dict_xml(value_elem, result, key_path + [key])
-                    elif value_elem.tag == 'array':
-                        for child in value_elem:
-                            if child.tag == 'dict':
-                                cls._parse_dict_xml(child, result, key_path)
-
-                    i += 2
-                else:
-                    i += 1
-            else:
-                i += 1
+    def _parse_dict_xml(cls, dict_elem, result: defaultdict):
+        """XML로 파싱 (중첩 <dict>는 재귀 대신 스택으로 순회)"""
+        stack = [dict_elem]
+
+        while stack:
+            # key/value 쌍을 이터레이터로 순회 (key 가 아닌 요소는 건너뛰어 짝을 맞춤)
+            it = iter(stack.pop())
+
+            for key_elem in it:
+                if key_elem.tag != 'key':
+                    continue
+                value_elem = next(it, None)
+                if value_elem is None:
+                    break
+
+                # 관심 키는 테이블 한 번 조회로 처리 (값 태그가 다르면 일반 컨테이너로 취급)
+                handler = _PLIST_KEY_HANDLERS.get(key_elem.text)
+                if handler is not None:
+                    add, category = handler
+                    if add(value_elem, result, category):
+                        continue
+
+                tag = value_elem.tag
+                if tag == 'dict':
+                    stack.append(value_elem)
+                elif tag == 'array':
+                    stack.extend(child for child in value_elem if child.tag == 'dict')
 
 
 class CoreDataParser:
@@ -316,35 +327,31 @@ class EntitlementsParser:
             if main_dict is None:
                 return dict(result)
 
-            children = list(main_dict)
-            i = 0
-
-            while i < len(children):
-                if children[i].tag == 'key':
-                    key = children[i].text
-                    if i + 1 < len(children):
-                        value_elem = children[i + 1]
-
-                        if key == 'com.apple.security.application-groups' and value_elem.tag == 'array':
-                            for string_elem in value_elem.findall('string'):
-                                if string_elem.text:
-                                    result['app_groups'].add(string_elem.text)
-
-                        elif key == 'keychain-access-groups' and value_elem.tag == 'array':
-                            for string_elem in value_elem.findall('string'):
-                                if string_elem.text:
-                                    result['keychain_groups'].add(string_elem.text)
-
-                        elif key == 'com.apple.developer.icloud-container-identifiers' and value_elem.tag == 'array':
-                            for string_elem in value_elem.findall('string'):
-                                if string_elem.text:
-                                    result['icloud_containers'].add(string_elem.text)
-
-                        i += 2
-                    else:
-                        i += 1
-                else:
-                    i += 1
+            # key/value 쌍을 이터레이터로 순회 (key 가 아닌 요소는 건너뛰어 짝을 맞춤)
+            it = iter(main_dict)
+
+            for key_elem in it:
+                if key_elem.tag != 'key':
+                    continue
+                value_elem = next(it, None)
+                if value_elem is None:
+                    break
+                key = key_elem.text
+
+                if key == 'com.apple.security.application-groups' and value_elem.tag == 'array':
+                    for string_elem in value_elem.findall('string'):
+                        if string_elem.text:
+                            result['app_groups'].add(string_elem.text)
+
+                elif key == 'keychain-access-groups' and value_elem.tag == 'array':
+                    for string_elem in value_elem.findall('string'):
+                        if string_elem.text:
+                            result['keychain_groups'].add(string_elem.text)
+
+                elif key == 'com.apple.developer.icloud-container-identifiers' and value_elem.tag == 'array':
+                    for string_elem in value_elem.findall('string'):
+                        if string_elem.text:
+                            result['icloud_containers'].add(string_elem.text)
 
         except Exception:
             pass
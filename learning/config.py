@@ -1,6 +1,8 @@
 # learning/config.py
 
 import os
+import sys
+import logging
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -20,6 +22,7 @@ class Config:
     # GitHub API
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")  # ✅ .env에서 자동 로드
     GITHUB_API_URL = "https://api.github.com"
+    GITHUB_RAW_URL = "https://raw.githubusercontent.com"
 
     # 수집 기준
     MIN_STARS = 100
@@ -31,6 +34,10 @@ class Config:
     MIN_OCCURRENCES = 3  # 최소 3회 이상 등장
     MIN_SWIFT_PERCENTAGE = 0.8  # 80% 이상
 
+    # Swift 소스 스캔에 RE2(google-re2) 사용 여부
+    # - 선형 시간이 보장되지만 매치당 오버헤드가 커서 일반 소스에서는 표준 re가 더 빠름
+    USE_RE2 = os.getenv("USE_RE2", "") == "1"
+
     # 검증 기준
     MIN_ACCURACY = 0.85  # 85% 이상 정확도
     MAX_FALSE_POSITIVE = 0.05  # 5% 이하 오탐률
@@ -65,6 +72,25 @@ class Config:
         cls.PROJECTS_DIR.mkdir(exist_ok=True)
 
 
+class _ProgressLogHandler(logging.StreamHandler):
+    """진행 로그 핸들러 (INFO 는 stdout 버퍼에 쓰기만 하고 WARNING 이상만 즉시 flush)"""
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def setup_logging():
+    """진행 로그 설정 (임포트 시점이 아니라 각 실행 진입점의 main()에서 호출)"""
+    # print 와 같은 sys.stdout 버퍼를 쓰므로 출력 순서는 그대로 유지됨
+    logging.basicConfig(format="%(message)s", level=logging.INFO,
+                        handlers=[_ProgressLogHandler(sys.stdout)])
+
+
 # 디렉토리 생성
 Config.ensure_dirs()
 
@@ -1,11 +1,69 @@
 # learning/github_crawler.py (개선 버전)
 
+import io
 import requests
 import json
+import logging
+import os
+import shutil
 import time
+from fractions import Fraction
 from pathlib import Path
-from typing import List, Dict, Optional
-from config import Config
+from typing import List, Dict, Optional, Set
+from config import Config, setup_logging
+
+log = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# 저장소 clone 한 건에 허용하는 최대 시간 (초)
+_CLONE_TIMEOUT = 300
+
+if pygit2 is not None:
+    class _CloneCallbacks(pygit2.RemoteCallbacks):
+        """전송 진행 콜백에서 제한 시간을 넘기면 예외를 던져 libgit2 clone 을 중단"""
+
+        def __init__(self, deadline: float):
+            super().__init__()
+            self.deadline = deadline
+
+        def _check_deadline(self):
+            if time.monotonic() > self.deadline:
+                raise TimeoutError(f"clone timed out after {_CLONE_TIMEOUT}s")
+
+        def transfer_progress(self, stats):
+            self._check_deadline()
+
+        def sideband_progress(self, string):
+            self._check_deadline()
+
+    # 응답이 없는 원격에서는 진행 콜백이 불리지 않으므로 소켓 타임아웃도 설정 (libgit2 1.7+)
+    try:
+        pygit2.option(pygit2.enums.Option.SET_SERVER_CONNECT_TIMEOUT, 30 * 1000)
+        pygit2.option(pygit2.enums.Option.SET_SERVER_TIMEOUT, 60 * 1000)
+    except (AttributeError, ValueError, pygit2.GitError):
+        pass
+
+# 검색 결과 본문 파싱 중 발생할 수 있는 오류 (ijson 미설치 시 response.json() 오류는 RequestException)
+_SEARCH_ERRORS = (requests.exceptions.RequestException,) + ((ijson.JSONError,) if ijson is not None else ())
 
 
 class GitHubCrawler:
@@ -20,6 +78,54 @@ class GitHubCrawler:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
 
+        # 프레임워크 이름 매처 (파일 한 번 순회로 모든 프레임워크 탐지)
+        self._fw_automaton = None
+        if ahocorasick is not None:
+            self._fw_automaton = ahocorasick.Automaton()
+            for framework in Config.POPULAR_FRAMEWORKS:
+                self._fw_automaton.add_word(framework.lower(), framework)
+            self._fw_automaton.make_automaton()
+
+        # Rate limit 상태 (응답 헤더로 갱신)
+        # search(30회/분)와 core(5000회/시간)는 예산이 따로이므로 X-RateLimit-Resource 별로 관리
+        self._rate_limits: Dict[str, Dict] = {}
+
+    def _rate_limit_bucket(self, resource: str) -> Dict:
+        """리소스별 rate limit 상태 (남은 요청 수, 리셋 시각, 마지막 호출 시각)"""
+        bucket = self._rate_limits.get(resource)
+        if bucket is None:
+            bucket = self._rate_limits[resource] = {"remaining": None, "reset": None, "last_call": 0.0}
+        return bucket
+
+    def _update_rate_limit(self, response: requests.Response):
+        """응답 헤더에서 해당 리소스의 남은 요청 수와 리셋 시각 갱신"""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None and reset is None:
+            return
+
+        bucket = self._rate_limit_bucket(response.headers.get("X-RateLimit-Resource", "core"))
+        if remaining is not None:
+            bucket["remaining"] = int(remaining)
+        if reset is not None:
+            bucket["reset"] = int(reset)
+
+    def _throttle(self, resource: str = "core"):
+        """
+        리소스의 남은 예산을 리셋 시각까지 고르게 나눠 쓰도록 필요한 만큼만 대기
+        (예산이 넉넉하면 대기 없음)
+        """
+        bucket = self._rate_limit_bucket(resource)
+        now = time.time()
+
+        if bucket["remaining"] is not None and bucket["reset"] is not None:
+            ideal_interval = max(0.0, (bucket["reset"] - now) / max(bucket["remaining"], 1))
+            wait_time = ideal_interval - (now - bucket["last_call"])
+            if wait_time > 0:
+                time.sleep(wait_time)
+
+        bucket["last_call"] = time.time()
+
     def get_language_stats(self, owner: str, repo: str) -> Dict[str, int]:
         """
         저장소의 언어 통계 가져오기
@@ -34,6 +140,7 @@ class GitHubCrawler:
         try:
             url = f"{Config.GITHUB_API_URL}/repos/{owner}/{repo}/languages"
             response = self.session.get(url)
+            self._update_rate_limit(response)
 
             if response.status_code == 200:
                 return response.json()
@@ -63,6 +170,43 @@ class GitHubCrawler:
 
         return swift_bytes / total_bytes
 
+    def swift_ratio_at_least(self, languages: Dict[str, int], threshold: float) -> bool:
+        """
+        Swift 비율이 threshold 이상인지 판정 (나눗셈 없이 정수 비교, 조기 종료)
+
+        Args:
+            languages: 언어별 바이트 수
+            threshold: 최소 Swift 비율 (0.0 ~ 1.0)
+
+        Returns:
+            Swift 비율 >= threshold 여부
+        """
+        if threshold <= 0:
+            return True
+
+        swift_bytes = languages.get("Swift", 0)
+        if swift_bytes == 0:
+            return False
+
+        # threshold 를 적힌 그대로의 분수로 (0.8 → 4/5, 0.875 → 7/8)
+        ratio = Fraction(str(threshold))
+        num, den = ratio.numerator, ratio.denominator
+
+        # swift / total >= num / den  <=>  swift * den >= num * total (정수 연산이라 경계값도 정확)
+        swift_scaled = swift_bytes * den
+        total = swift_bytes
+        if swift_scaled < num * total:
+            return False
+
+        for language, size in languages.items():
+            if language == "Swift":
+                continue
+            total += size
+            if swift_scaled < num * total:
+                return False
+
+        return True
+
     def search_repositories(
             self,
             language: str = "Swift",
@@ -82,10 +226,10 @@ class GitHubCrawler:
         Returns:
             저장소 정보 리스트
         """
-        print(f"🔍 Searching GitHub repositories...")
-        print(f"   Language: {language}, Min Stars: {min_stars}")
-        print(f"   Min Swift %: {min_swift_percentage * 100:.0f}%")
-        print(f"   Target: {max_results} projects")
+        log.info("🔍 Searching GitHub repositories...")
+        log.info("   Language: %s, Min Stars: %d", language, min_stars)
+        log.info("   Min Swift %%: %.0f%%", min_swift_percentage * 100)
+        log.info("   Target: %d projects", max_results)
 
         query = f"language:{language} stars:>={min_stars}"
         url = f"{Config.GITHUB_API_URL}/search/repositories"
@@ -106,16 +250,22 @@ class GitHubCrawler:
             params["page"] = page
 
             try:
+                # 검색 API는 별도 예산(search)으로 페이지 요청 간격 조절
+                self._throttle("search")
                 response = self.session.get(url, params=params)
+                self._update_rate_limit(response)
                 response.raise_for_status()
 
-                data = response.json()
-                items = data.get("items", [])
-
-                if not items:
-                    break
+                # ijson이 있으면 페이지 전체를 dict로 만들지 않고 item 단위로 파싱
+                # (본문은 먼저 모두 읽어 연결을 반환 → 언어 API 호출/대기 중에 연결을 붙잡지 않음)
+                if ijson is not None:
+                    items = ijson.items(io.BytesIO(response.content), "items.item")
+                else:
+                    items = response.json().get("items", [])
 
+                has_items = False
                 for item in items:
+                    has_items = True
                     if len(repositories) >= max_results:
                         break
 
@@ -126,13 +276,15 @@ class GitHubCrawler:
 
                     # ✅ 언어 통계 가져오기
                     languages = self.get_language_stats(owner, repo_name)
-                    swift_percentage = self.calculate_swift_percentage(languages)
 
-                    # ✅ Swift 비율 체크
-                    if swift_percentage < min_swift_percentage:
-                        print(f"   ⏭️  [{checked_count}] {item['full_name']} - Swift {swift_percentage:.1%} (skip)")
+                    # ✅ Swift 비율 체크 (건너뛴 저장소도 MIN_SWIFT_PERCENTAGE 조정용으로 실제 비율을 기록)
+                    if not self.swift_ratio_at_least(languages, min_swift_percentage):
+                        log.info("   ⏭️  [%d] %s - Swift %.1f%% (skip)",
+                                 checked_count, item["full_name"],
+                                 self.calculate_swift_percentage(languages) * 100)
                         continue
 
+                    swift_percentage = self.calculate_swift_percentage(languages)
                     repo_info = {
                         "name": item["name"],
                         "full_name": item["full_name"],
@@ -151,11 +303,15 @@ class GitHubCrawler:
                     }
 
                     repositories.append(repo_info)
-                    print(
-                        f"   ✅ [{len(repositories)}/{max_results}] {repo_info['full_name']} ({repo_info['stars']}⭐, Swift {swift_percentage:.1%})")
+                    log.info("   ✅ [%d/%d] %s (%d⭐, Swift %.1f%%)",
+                             len(repositories), max_results, repo_info["full_name"],
+                             repo_info["stars"], swift_percentage * 100)
+
+                    # Rate limit 조심 (언어 통계 API의 core 예산 기준으로만 대기)
+                    self._throttle("core")
 
-                    # Rate limit 조심
-                    time.sleep(0.5)  # ✅ API 호출 간 대기
+                if not has_items:
+                    break
 
                 page += 1
 
@@ -164,61 +320,70 @@ class GitHubCrawler:
                     reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
                     wait_time = reset_time - time.time()
                     if wait_time > 0:
-                        print(f"⏳ Rate limit reached. Waiting {wait_time:.0f}s...")
+                        log.warning("⏳ Rate limit reached. Waiting %.0fs...", wait_time)
                         time.sleep(wait_time + 1)
 
-            except requests.exceptions.RequestException as e:
-                print(f"❌ Error fetching repositories: {e}")
+            except _SEARCH_ERRORS as e:
+                log.error("❌ Error fetching repositories: %s", e)
                 break
 
-        print(f"\n✅ Found {len(repositories)} repositories (checked {checked_count})")
-        print(f"   Average Swift %: {sum(r['swift_percentage'] for r in repositories) / len(repositories) * 100:.1f}%")
+        log.info("\n✅ Found %d repositories (checked %d)", len(repositories), checked_count)
+        if repositories:
+            log.info("   Average Swift %%: %.1f%%",
+                     sum(r["swift_percentage"] for r in repositories) / len(repositories) * 100)
 
         return repositories
 
     # ... 나머지 메서드는 동일 ...
 
-    def get_repository_dependencies(self, owner: str, repo: str) -> List[str]:
-        """저장소의 의존성 확인 (Package.swift, Podfile)"""
-        dependencies = []
+    def _fetch_raw_file(self, owner: str, repo: str, branch: str, path: str) -> Optional[str]:
+        """
+        raw.githubusercontent.com에서 파일 본문을 직접 가져오기
+        (contents API의 JSON 래핑/base64 디코딩 생략)
 
-        # Package.swift 확인
-        try:
-            url = f"{Config.GITHUB_API_URL}/repos/{owner}/{repo}/contents/Package.swift"
-            response = self.session.get(url)
+        Returns:
+            파일 내용 (없으면 None)
+        """
+        url = f"{Config.GITHUB_RAW_URL}/{owner}/{repo}/{branch}/{path}"
+        response = self.session.get(url)
 
-            if response.status_code == 200:
-                content = response.json()
-                import base64
-                decoded = base64.b64decode(content["content"]).decode("utf-8")
+        if response.status_code == 200:
+            return response.text
+        return None
 
-                for framework in Config.POPULAR_FRAMEWORKS:
-                    if framework.lower() in decoded.lower():
-                        dependencies.append(framework)
-        except:
-            pass
+    def _match_frameworks(self, text: str) -> Set[str]:
+        """파일 내용에서 언급된 프레임워크 이름 찾기 (대소문자 무시)"""
+        text_l = text.lower()
 
-        # Podfile 확인
-        try:
-            url = f"{Config.GITHUB_API_URL}/repos/{owner}/{repo}/contents/Podfile"
-            response = self.session.get(url)
+        if self._fw_automaton is not None:
+            return {framework for _, framework in self._fw_automaton.iter(text_l)}
 
-            if response.status_code == 200:
-                content = response.json()
-                import base64
-                decoded = base64.b64decode(content["content"]).decode("utf-8")
-
-                for framework in Config.POPULAR_FRAMEWORKS:
-                    if framework.lower() in decoded.lower():
-                        if framework not in dependencies:
-                            dependencies.append(framework)
-        except:
-            pass
+        return {framework for framework in Config.POPULAR_FRAMEWORKS if framework.lower() in text_l}
+
+    def get_repository_dependencies(self, owner: str, repo: str, default_branch: str = "HEAD") -> List[str]:
+        """저장소의 의존성 확인 (Package.swift, Podfile)"""
+        found = set()
+
+        # Package.swift, Podfile 확인
+        for manifest in ("Package.swift", "Podfile"):
+            try:
+                decoded = self._fetch_raw_file(owner, repo, default_branch, manifest)
+
+                if decoded is not None:
+                    found |= self._match_frameworks(decoded)
+            except:
+                pass
 
-        return dependencies
+        return [framework for framework in Config.POPULAR_FRAMEWORKS if framework in found]
 
     def download_repository(self, repo_info: Dict) -> Optional[Path]:
         """저장소를 로컬로 다운로드"""
+        # 이전 실행에서 기록된 경로가 있으면 그것만 확인
+        cached = repo_info.get("local_path")
+        if cached and os.path.isdir(cached):
+            print(f"   ⏭️  Already exists: {Path(cached).name}")
+            return Path(cached)
+
         full_name = repo_info["full_name"].replace("/", "_")
         target_dir = Config.PROJECTS_DIR / full_name
 
@@ -229,6 +394,27 @@ class GitHubCrawler:
         swift_pct = repo_info.get("swift_percentage", 0)
         print(f"   📥 Downloading: {repo_info['full_name']} (Swift {swift_pct:.1%})...")
 
+        # pygit2가 있으면 프로세스 생성 없이 libgit2로 직접 clone
+        if pygit2 is not None:
+            try:
+                pygit2.clone_repository(
+                    repo_info["clone_url"],
+                    str(target_dir),
+                    depth=1,
+                    callbacks=_CloneCallbacks(time.monotonic() + _CLONE_TIMEOUT)
+                )
+                print(f"   ✅ Downloaded: {full_name}")
+                return target_dir
+            except TimeoutError as e:
+                print(f"   ❌ Failed: {e}")
+                # 중간에 실패한 디렉토리는 다음 실행에서 재시도되도록 삭제
+                shutil.rmtree(target_dir, ignore_errors=True)
+                return None
+            except Exception as e:
+                # libgit2 빌드/URL/경로 문제 등은 git 명령으로 한 번 더 시도
+                print(f"   ⚠️  pygit2 clone failed ({e}), retrying with git...")
+                shutil.rmtree(target_dir, ignore_errors=True)
+
         try:
             import subprocess
 
@@ -236,7 +422,7 @@ class GitHubCrawler:
                 ["git", "clone", "--depth", "1", repo_info["clone_url"], str(target_dir)],
                 capture_output=True,
                 text=True,
-                timeout=300
+                timeout=_CLONE_TIMEOUT
             )
 
             if result.returncode == 0:
@@ -254,8 +440,12 @@ class GitHubCrawler:
         """프로젝트 목록 저장"""
         output_path = Config.DATA_DIR / filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(projects, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(projects, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(projects, f, indent=2, ensure_ascii=False)
 
         print(f"💾 Saved {len(projects)} projects to {output_path}")
 
@@ -266,12 +456,17 @@ class GitHubCrawler:
         if not input_path.exists():
             return []
 
+        if orjson is not None:
+            return orjson.loads(input_path.read_bytes())
+
         with open(input_path, "r", encoding="utf-8") as f:
             return json.load(f)
 
 
 def main():
     """메인 실행 함수"""
+    setup_logging()
+
     print("=" * 70)
     print("🚀 GitHub Swift Project Crawler")
     print("=" * 70)
@@ -292,7 +487,8 @@ def main():
         print(f"   [{i}/{len(projects)}] {project['full_name']}")
         deps = crawler.get_repository_dependencies(
             project["owner"],
-            project["name"]
+            project["name"],
+            project.get("default_branch", "HEAD")
         )
         project["dependencies"] = deps
         if deps:
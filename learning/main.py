@@ -1,13 +1,9 @@
 # learning/main.py
 
 import sys
+import importlib
 from pathlib import Path
-from config import Config
-import github_crawler
-import pattern_extractor
-import rule_generator
-import validator
-import merge_rules
+from config import Config, setup_logging
 
 
 def print_menu():
@@ -28,6 +24,12 @@ def print_menu():
 
 def run_full_pipeline():
     """전체 파이프라인 실행"""
+    # 각 단계 모듈은 메뉴 핸들러와 마찬가지로 실행 시점에 로드
+    import github_crawler
+    import pattern_extractor
+    import rule_generator
+    import validator
+
     print("\n" + "=" * 70)
     print("🚀 Running Full Learning Pipeline")
     print("=" * 70)
@@ -46,7 +48,8 @@ def run_full_pipeline():
     for project in projects:
         deps = crawler.get_repository_dependencies(
             project["owner"],
-            project["name"]
+            project["name"],
+            project.get("default_branch", "HEAD")
         )
         project["dependencies"] = deps
 
@@ -67,14 +70,7 @@ def run_full_pipeline():
     extractor = pattern_extractor.PatternExtractor()
 
     downloaded_projects = [p for p in projects if "local_path" in p]
-
-    for i, project in enumerate(downloaded_projects, 1):
-        print(f"\n[{i}/{len(downloaded_projects)}]")
-        project_path = Path(project["local_path"])
-        dependencies = project.get("dependencies", [])
-
-        if project_path.exists():
-            extractor.analyze_project(project_path, dependencies)
+    extractor.analyze_all_projects(downloaded_projects)
 
     frequent_patterns = extractor.get_frequent_patterns(
         min_frequency=Config.MIN_FREQUENCY,
@@ -125,30 +121,39 @@ def run_full_pipeline():
     print("=" * 70)
 
 
+def _lazy_main(module_name: str):
+    """모듈을 처음 선택했을 때 임포트하고 main 함수 반환"""
+    return importlib.import_module(module_name).main
+
+
+# 메뉴 번호 → 실행 함수 (각 단계 모듈은 선택 시점에 로드)
+DISPATCH = {
+    "1": lambda: _lazy_main("github_crawler")(),
+    "2": lambda: _lazy_main("pattern_extractor")(),
+    "3": lambda: _lazy_main("rule_generator")(),
+    "4": lambda: _lazy_main("validator")(),
+    "5": lambda: _lazy_main("merge_rules")(),
+    "6": run_full_pipeline,
+}
+
+
 def main():
     """메인 함수"""
     Config.ensure_dirs()
+    setup_logging()
 
     while True:
         print_menu()
 
         choice = input("\nSelect option: ").strip()
 
-        if choice == "1":
-            github_crawler.main()
-        elif choice == "2":
-            pattern_extractor.main()
-        elif choice == "3":
-            rule_generator.main()
-        elif choice == "4":
-            validator.main()
-        elif choice == "5":
-            merge_rules.main()
-        elif choice == "6":
-            run_full_pipeline()
-        elif choice == "0":
+        if choice == "0":
             print("\n👋 Goodbye!")
             break
+
+        handler = DISPATCH.get(choice)
+        if handler:
+            handler()
         else:
             print("\n❌ Invalid option. Please try again.")
 
@@ -5,6 +5,11 @@ from pathlib import Path
 from typing import Dict, List
 from config import Config
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 
 class RuleMerger:
     """규칙 파일 병합 및 중복 제거"""
@@ -13,7 +18,7 @@ class RuleMerger:
     def load_rules(filepath: Path) -> List[Dict]:
         """YAML 규칙 로드"""
         with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
             return data.get("rules", [])
 
     @staticmethod
@@ -99,7 +104,7 @@ class RuleMerger:
         output = {"rules": rules}
 
         with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(output, f, allow_unicode=True, sort_keys=False, width=120)
+            yaml.dump(output, f, Dumper=SafeDumper, allow_unicode=True, sort_keys=False, width=120)
 
         print(f"💾 Saved {len(rules)} rules to {filepath}")
 
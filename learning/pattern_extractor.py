@@ -1,35 +1,295 @@
 # learning/pattern_extractor.py
 
+import heapq
 import json
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import groupby, repeat
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from collections import Counter
 from config import Config
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Swift 소스 패턴 (프로퍼티/메서드/타입/프로토콜을 한 번의 스캔으로 추출)
+# 모든 패턴이 ASCII이므로 파일을 디코딩하지 않고 bytes 그대로 매칭
+# - 'class var'/'class func'는 타입 선언이 아니라 프로퍼티/메서드로 먼저 매칭
+# - meth_gap: 이름과 '(' 사이 공백 (델리게이트 판정에 사용)
+# - 역참조/전방탐색이 없어 RE2로도 그대로 컴파일됨 (Config.USE_RE2)
+_FUSED_BRANCHES = (
+    ("prop", rb'(?P<prop>(?:class\s+)?(?:var|let)\s+(?P<prop_name>\w+)\s*:)'),
+    ("meth", rb'(?P<meth>(?:class\s+)?func\s+(?P<meth_name>\w+)(?P<meth_gap>\s*)\()'),
+    ("cls", rb'(?P<cls>(?:class|struct|enum)\s+(?P<cls_name>\w+))'),
+    ("proto", rb'(?P<proto>protocol\s+(?P<proto_name>\w+))')
+)
+# 분기별 필수 리터럴: 파일에 하나도 없으면 그 분기는 어디서도 매칭될 수 없음
+_BRANCH_ANCHORS = {
+    "prop": (b"var", b"let"),
+    "meth": (b"func",),
+    "cls": (b"class", b"struct", b"enum"),
+    "proto": (b"protocol",)
+}
+_REGEX_ENGINE = re2 if Config.USE_RE2 and re2 is not None else re
+
+
+@lru_cache(maxsize=None)
+def _fused_scanner(kinds: Tuple[str, ...]):
+    """
+    주어진 분기만으로 이루어진 통합 정규식 (분기 조합별로 한 번만 컴파일)
+
+    Returns:
+        (정규식, lastindex → (kind, 이름 그룹 번호), meth_gap 그룹 번호)
+    """
+    fused = _REGEX_ENGINE.compile(b"|".join(branch for kind, branch in _FUSED_BRANCHES if kind in kinds))
+    # re2는 bytes 패턴의 그룹 이름도 bytes로 돌려주므로 lastgroup 대신 lastindex로 분기
+    # (각 분기의 바깥 그룹이 마지막에 닫히므로 lastindex = 분기 그룹 번호)
+    group_index = {(name.decode() if isinstance(name, bytes) else name): index
+                   for name, index in fused.groupindex.items()}
+    kind_by_index = {group_index[kind]: (kind, group_index[f"{kind}_name"]) for kind in kinds}
+    return fused, kind_by_index, group_index.get("meth_gap")
+
+
+def _present_kinds(content) -> Tuple[str, ...]:
+    """필수 리터럴이 파일에 있는 분기만 선택 (mmap은 'in'이 바이트 검색이 아니므로 find 사용)"""
+    return tuple(kind for kind, _ in _FUSED_BRANCHES
+                 if any(content.find(anchor) != -1 for anchor in _BRANCH_ANCHORS[kind]))
+
+# 델리게이트 메서드 이름 판정 (패턴마다 1회씩 카운트)
+_DELEGATE_NAME_TESTS = (
+    re.compile(r'(?:tableView|collectionView|scrollView)').match,
+    re.compile(r'(?:did|will|should)').match,
+    re.compile(r'(?:DidSelect|WillDisplay|DidEnd)').search
+)
+
+# 아키텍처 역할을 나타내는 클래스 접미사 (긴 접미사 우선)
+_SUFFIXES = ("ViewController", "ViewModel", "Coordinator", "Cell", "View", "Service", "Manager")
+
+
+def _class_suffix(name: str):
+    """이름이 끝나는 아키텍처 접미사 반환 (없으면 None)"""
+    if not name.endswith(_SUFFIXES):
+        return None
+    return next(suffix for suffix in _SUFFIXES if name.endswith(suffix))
+
+
+# 프레임워크 특화 패턴 (리터럴 → (프레임워크, 카테고리))
+_FRAMEWORK_LITERALS = {
+    ".bind(to:": ("RxSwift", "rx_binding"),
+    ".subscribe(": ("RxSwift", "rx_binding"),
+    "Observable.": ("RxSwift", "rx_binding"),
+    "disposeBag": ("RxSwift", "rx_binding"),
+    "AF.request(": ("Alamofire", "networking"),
+    ".response(": ("Alamofire", "networking"),
+    ".validate(": ("Alamofire", "networking")
+}
+_FRAMEWORK_LITERAL_BYTES = [(literal, literal.encode(), tag) for literal, tag in _FRAMEWORK_LITERALS.items()]
+_FRAMEWORK_NAME_BYTES = {framework: framework.encode() for framework, _ in _FRAMEWORK_LITERALS.values()}
+
+# 이 크기 이상인 파일은 통째로 읽지 않고 mmap으로 스캔 (한 페이지 미만은 read가 더 저렴)
+_MMAP_MIN_SIZE = mmap.PAGESIZE
+
+# 워커 한 번에 넘기는 파일 수 (이하이면 현재 프로세스에서 바로 스캔)
+_FILES_PER_TASK = 32
+
+# 모든 리터럴을 한 번의 스캔으로 세기 위한 Aho-Corasick 오토마톤
+_FRAMEWORK_AC = None
+if ahocorasick is not None:
+    _FRAMEWORK_AC = ahocorasick.Automaton()
+    for _literal, _tag in _FRAMEWORK_LITERALS.items():
+        _FRAMEWORK_AC.add_word(_literal, (_literal, _tag))
+    _FRAMEWORK_AC.make_automaton()
+
+# 오토마톤에 한 번에 넘기는 바이트 수 (파일 전체를 str로 복사하지 않도록 구간별로 디코딩)
+_AC_CHUNK_SIZE = 1 << 16
+# 구간 경계에 걸친 리터럴을 놓치지 않도록 이전 구간과 겹쳐 읽는 길이
+_AC_OVERLAP = max(len(literal) for literal in _FRAMEWORK_LITERALS) - 1
+
+
+def _new_pattern_counters() -> Dict:
+    """빈 패턴 카운터 (워커 결과를 프로세스 간에 주고받을 수 있도록 lambda 미사용)"""
+    return {
+        "property_names": Counter(),
+        "method_names": Counter(),
+        "class_names": Counter(),
+        "protocol_names": Counter(),
+        "delegate_methods": Counter(),
+        "framework_patterns": Counter(),  # (프레임워크, 카테고리) → 등장 횟수
+        "architecture_patterns": Counter()
+    }
+
+
+def _merge_pattern_counters(target: Dict, partial: Dict):
+    """부분 카운터를 target에 병합"""
+    for key, counter in partial.items():
+        target[key].update(counter)
+
+
+def _count_literal(content, literal: bytes) -> int:
+    """겹치지 않는 리터럴 등장 횟수 (bytes/mmap 공통, mmap에는 count()가 없음)"""
+    count = 0
+    pos = content.find(literal)
+    while pos != -1:
+        count += 1
+        pos = content.find(literal, pos + len(literal))
+    return count
+
+
+def _count_framework_literals(content, active: Set[str], framework_patterns: Counter):
+    """오토마톤으로 리터럴 등장 횟수 집계 (bytes/mmap을 memoryview 구간 단위로 스캔)"""
+    with memoryview(content) as view:
+        size = len(view)
+        start = 0
+        while start < size:
+            end = min(start + _AC_CHUNK_SIZE, size)
+            window_start = max(start - _AC_OVERLAP, 0)
+            # 오토마톤은 str 기반: latin-1은 바이트를 1:1로 매핑하므로 ASCII 리터럴 매칭 결과 동일
+            text = str(view[window_start:end], "latin-1")
+            # 겹친 구간 안에서 끝나는 매칭은 이전 구간에서 이미 셌음
+            overlap = start - window_start
+            for end_index, (literal, (framework, category)) in _FRAMEWORK_AC.iter(text):
+                if end_index >= overlap and framework in active:
+                    framework_patterns[framework, category] += 1
+            start = end
+
+
+def _extract_patterns_from_file(content, dependencies: List[str], patterns: Dict):
+    """파일에서 패턴 추출 (content: bytes 또는 mmap, patterns 카운터에 누적)"""
+
+    counters = {
+        "prop": patterns["property_names"],
+        "meth": patterns["method_names"],
+        "cls": patterns["class_names"],
+        "proto": patterns["protocol_names"]
+    }
+    architecture = patterns["architecture_patterns"]
+    delegates = patterns["delegate_methods"]
+    # 같은 식별자(id, name, delegate 등)가 파일마다 반복되므로 intern으로 해시/메모리 공유
+    intern = sys.intern
+
+    # 1~5. 프로퍼티/메서드/클래스/프로토콜/델리게이트 (단일 스캔, 앵커가 있는 분기만)
+    present = _present_kinds(content)
+    matches = ()
+    if present:
+        fused, kinds, meth_gap_group = _fused_scanner(present)
+        matches = fused.finditer(content)
+
+    for match in matches:
+        kind, name_group = kinds[match.lastindex]
+        name = intern(match.group(name_group).decode("ascii"))
+
+        if kind == "prop":
+            if name.startswith("_"):  # private 제외
+                continue
+
+        elif kind == "meth":
+            # 델리게이트 메서드 (이름 바로 뒤에 '('가 오는 경우만)
+            if not match.group(meth_gap_group):
+                for test in _DELEGATE_NAME_TESTS:
+                    if test(name):
+                        delegates[name] += 1
+
+        elif kind == "cls":
+            # 아키텍처 패턴 감지
+            suffix = _class_suffix(name)
+            if suffix is not None:
+                architecture[suffix] += 1
+
+        counters[kind][name] += 1
+
+    # 6. 프레임워크 특화 패턴 (파일에서 실제로 언급된 의존성만)
+    if dependencies:
+        active = {fw for fw in dependencies
+                  if fw in _FRAMEWORK_NAME_BYTES and content.find(_FRAMEWORK_NAME_BYTES[fw]) != -1}
+
+        if active:
+            framework_patterns = patterns["framework_patterns"]
+
+            if _FRAMEWORK_AC is not None:
+                _count_framework_literals(content, active, framework_patterns)
+            else:
+                for literal, literal_bytes, (framework, category) in _FRAMEWORK_LITERAL_BYTES:
+                    if framework in active:
+                        count = _count_literal(content, literal_bytes)
+                        if count > 0:
+                            framework_patterns[framework, category] += count
+
+
+def _scan_files(swift_files: List[Path], dependencies: List[str]) -> Dict:
+    """워커 프로세스: 파일 묶음을 스캔해 부분 카운터 반환"""
+    patterns = _new_pattern_counters()
+
+    for swift_file in swift_files:
+        try:
+            with open(swift_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                    _extract_patterns_from_file(f.read(), dependencies, patterns)
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        _extract_patterns_from_file(mm, dependencies, patterns)
+        except Exception:
+            continue
+
+    return patterns
+
 
 class PatternExtractor:
     """다운로드된 프로젝트에서 패턴 추출"""
 
     def __init__(self):
-        self.patterns = {
-            "property_names": Counter(),
-            "method_names": Counter(),
-            "class_names": Counter(),
-            "protocol_names": Counter(),
-            "delegate_methods": Counter(),
-            "framework_patterns": defaultdict(lambda: defaultdict(Counter)),
-            "architecture_patterns": Counter()
-        }
+        self.patterns = _new_pattern_counters()
         self.total_projects = 0
 
-    def analyze_project(self, project_path: Path, dependencies: List[str] = None):
+    def analyze_all_projects(self, projects: List[Dict]):
+        """
+        다운로드된 프로젝트 전체 분석
+
+        Args:
+            projects: local_path/dependencies 를 가진 프로젝트 목록
+        """
+        # 프로세스 풀은 실행당 한 번만 만들어 모든 프로젝트가 공유 (워커는 첫 작업 제출 시 생성)
+        with ProcessPoolExecutor() as executor:
+            for i, project in enumerate(projects, 1):
+                print(f"\n[{i}/{len(projects)}]")
+                project_path = Path(project["local_path"])
+                dependencies = project.get("dependencies", [])
+
+                if project_path.exists():
+                    self.analyze_project(project_path, dependencies, executor)
+                else:
+                    print(f"   ⚠️  Path not found: {project_path}")
+
+    def analyze_project(
+            self,
+            project_path: Path,
+            dependencies: List[str] = None,
+            executor: Optional[Executor] = None
+    ):
         """
         프로젝트 분석
 
         Args:
             project_path: 프로젝트 경로
             dependencies: 의존하는 프레임워크 목록
+            executor: 파일 묶음 스캔에 사용할 프로세스 풀 (없으면 이 프로젝트용으로 생성)
         """
         print(f"   📊 Analyzing: {project_path.name}")
 
@@ -41,95 +301,21 @@ class PatternExtractor:
 
         print(f"      Found {len(swift_files)} Swift files")
 
-        for swift_file in swift_files:
-            try:
-                content = swift_file.read_text(encoding="utf-8")
-                self._extract_patterns_from_file(content, dependencies)
-            except Exception as e:
-                continue
+        # 파일 단위 스캔은 서로 독립적이므로 프로세스 풀로 병렬 처리
+        if len(swift_files) <= _FILES_PER_TASK:
+            _merge_pattern_counters(self.patterns, _scan_files(swift_files, dependencies))
+        else:
+            batches = [swift_files[i:i + _FILES_PER_TASK] for i in range(0, len(swift_files), _FILES_PER_TASK)]
+            if executor is None:
+                with ProcessPoolExecutor() as own_executor:
+                    for partial in own_executor.map(_scan_files, batches, repeat(dependencies)):
+                        _merge_pattern_counters(self.patterns, partial)
+            else:
+                for partial in executor.map(_scan_files, batches, repeat(dependencies)):
+                    _merge_pattern_counters(self.patterns, partial)
 
         self.total_projects += 1
 
-    def _extract_patterns_from_file(self, content: str, dependencies: List[str] = None):
-        """파일에서 패턴 추출"""
-
-        # 1. 프로퍼티 이름
-        property_pattern = r'(?:var|let)\s+(\w+)\s*:'
-        for match in re.finditer(property_pattern, content):
-            name = match.group(1)
-            if not name.startswith("_"):  # private 제외
-                self.patterns["property_names"][name] += 1
-
-        # 2. 메서드 이름
-        method_pattern = r'func\s+(\w+)\s*\('
-        for match in re.finditer(method_pattern, content):
-            name = match.group(1)
-            self.patterns["method_names"][name] += 1
-
-        # 3. 클래스/구조체 이름
-        class_pattern = r'(?:class|struct|enum)\s+(\w+)'
-        for match in re.finditer(class_pattern, content):
-            name = match.group(1)
-            self.patterns["class_names"][name] += 1
-
-            # 아키텍처 패턴 감지
-            if "ViewController" in name:
-                self.patterns["architecture_patterns"]["ViewController"] += 1
-            if "ViewModel" in name:
-                self.patterns["architecture_patterns"]["ViewModel"] += 1
-            if "Coordinator" in name:
-                self.patterns["architecture_patterns"]["Coordinator"] += 1
-            if name.endswith("Cell"):
-                self.patterns["architecture_patterns"]["Cell"] += 1
-
-        # 4. 프로토콜 이름
-        protocol_pattern = r'protocol\s+(\w+)'
-        for match in re.finditer(protocol_pattern, content):
-            name = match.group(1)
-            self.patterns["protocol_names"][name] += 1
-
-        # 5. 델리게이트 메서드 (특정 패턴)
-        delegate_patterns = [
-            r'func\s+(tableView|collectionView|scrollView)\w*\(',
-            r'func\s+(did|will|should)\w*\(',
-            r'func\s+\w*(DidSelect|WillDisplay|DidEnd)\w*\('
-        ]
-
-        for pattern in delegate_patterns:
-            for match in re.finditer(pattern, content):
-                full_match = match.group(0)
-                method_name = re.search(r'func\s+(\w+)', full_match).group(1)
-                self.patterns["delegate_methods"][method_name] += 1
-
-        # 6. 프레임워크 특화 패턴
-        if dependencies:
-            for framework in dependencies:
-                if framework in content:
-                    # RxSwift
-                    if framework == "RxSwift":
-                        rx_patterns = [
-                            r'\.bind\(to:',
-                            r'\.subscribe\(',
-                            r'Observable\.',
-                            r'disposeBag'
-                        ]
-                        for pattern in rx_patterns:
-                            count = len(re.findall(pattern, content))
-                            if count > 0:
-                                self.patterns["framework_patterns"][framework]["rx_binding"] += count
-
-                    # Alamofire
-                    if framework == "Alamofire":
-                        af_patterns = [
-                            r'AF\.request\(',
-                            r'\.response\(',
-                            r'\.validate\('
-                        ]
-                        for pattern in af_patterns:
-                            count = len(re.findall(pattern, content))
-                            if count > 0:
-                                self.patterns["framework_patterns"][framework]["networking"] += count
-
     def get_frequent_patterns(
             self,
             min_frequency: float = 0.6,
@@ -154,10 +340,11 @@ class PatternExtractor:
         }
 
         threshold = int(self.total_projects * min_frequency)
+        min_count = max(threshold, min_occurrences)
 
         # 프로퍼티 이름
         for name, count in self.patterns["property_names"].items():
-            if count >= max(threshold, min_occurrences):
+            if count >= min_count:
                 frequent["property_names"].append({
                     "name": name,
                     "count": count,
@@ -166,7 +353,7 @@ class PatternExtractor:
 
         # 메서드 이름
         for name, count in self.patterns["method_names"].items():
-            if count >= max(threshold, min_occurrences):
+            if count >= min_count:
                 frequent["method_names"].append({
                     "name": name,
                     "count": count,
@@ -176,9 +363,9 @@ class PatternExtractor:
         # 클래스 접미사 (ViewController, ViewModel 등)
         suffix_counter = Counter()
         for name in self.patterns["class_names"].keys():
-            for suffix in ["ViewController", "ViewModel", "Coordinator", "Cell", "View", "Service", "Manager"]:
-                if name.endswith(suffix):
-                    suffix_counter[suffix] += 1
+            suffix = _class_suffix(name)
+            if suffix is not None:
+                suffix_counter[suffix] += 1
 
         for suffix, count in suffix_counter.items():
             if count >= threshold:
@@ -190,7 +377,7 @@ class PatternExtractor:
 
         # 델리게이트 메서드
         for name, count in self.patterns["delegate_methods"].items():
-            if count >= max(threshold, min_occurrences):
+            if count >= min_count:
                 frequent["delegate_methods"].append({
                     "name": name,
                     "count": count,
@@ -198,15 +385,13 @@ class PatternExtractor:
                 })
 
         # 프레임워크 패턴
-        for framework, patterns in self.patterns["framework_patterns"].items():
-            frequent["framework_patterns"][framework] = []
-            for pattern_name, counter in patterns.items():
-                total = sum(counter.values())
-                if total >= threshold:
-                    frequent["framework_patterns"][framework].append({
-                        "pattern": pattern_name,
-                        "count": total
-                    })
+        framework_items = sorted(self.patterns["framework_patterns"].items())
+        for framework, items in groupby(framework_items, key=lambda item: item[0][0]):
+            frequent["framework_patterns"][framework] = [
+                {"pattern": category, "count": total}
+                for (_, category), total in items
+                if total >= threshold
+            ]
 
         return frequent
 
@@ -214,8 +399,12 @@ class PatternExtractor:
         """패턴 저장"""
         output_path = Config.DATA_DIR / filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(patterns, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(patterns, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(patterns, f, indent=2, ensure_ascii=False)
 
         print(f"💾 Saved patterns to {output_path}")
 
@@ -228,11 +417,11 @@ class PatternExtractor:
         report.append(f"\n📈 Total Projects Analyzed: {self.total_projects}")
 
         report.append(f"\n🔤 Frequent Property Names ({len(patterns['property_names'])} found):")
-        for item in sorted(patterns["property_names"], key=lambda x: x["frequency"], reverse=True)[:20]:
+        for item in heapq.nlargest(20, patterns["property_names"], key=lambda x: x["frequency"]):
             report.append(f"   • {item['name']:<20} {item['count']:>4} times ({item['frequency']:.1%})")
 
         report.append(f"\n⚙️  Frequent Method Names ({len(patterns['method_names'])} found):")
-        for item in sorted(patterns["method_names"], key=lambda x: x["frequency"], reverse=True)[:20]:
+        for item in heapq.nlargest(20, patterns["method_names"], key=lambda x: x["frequency"]):
             report.append(f"   • {item['name']:<20} {item['count']:>4} times ({item['frequency']:.1%})")
 
         report.append(f"\n🏗️  Class Name Suffixes ({len(patterns['class_suffixes'])} found):")
@@ -240,7 +429,7 @@ class PatternExtractor:
             report.append(f"   • {item['suffix']:<20} {item['count']:>4} times ({item['frequency']:.1%})")
 
         report.append(f"\n📡 Delegate Methods ({len(patterns['delegate_methods'])} found):")
-        for item in sorted(patterns["delegate_methods"], key=lambda x: x["frequency"], reverse=True)[:15]:
+        for item in heapq.nlargest(15, patterns["delegate_methods"], key=lambda x: x["frequency"]):
             report.append(f"   • {item['name']:<30} {item['count']:>4} times ({item['frequency']:.1%})")
 
         if patterns["framework_patterns"]:
@@ -267,8 +456,11 @@ def main():
         print("❌ No projects.json found. Run github_crawler.py first.")
         return
 
-    with open(projects_file, "r", encoding="utf-8") as f:
-        projects = json.load(f)
+    if orjson is not None:
+        projects = orjson.loads(projects_file.read_bytes())
+    else:
+        with open(projects_file, "r", encoding="utf-8") as f:
+            projects = json.load(f)
 
     # 다운로드된 프로젝트만 필터링
     downloaded_projects = [p for p in projects if "local_path" in p]
@@ -284,15 +476,7 @@ def main():
     extractor = PatternExtractor()
 
     print("\n🔍 Extracting patterns...")
-    for i, project in enumerate(downloaded_projects, 1):
-        print(f"\n[{i}/{len(downloaded_projects)}]")
-        project_path = Path(project["local_path"])
-        dependencies = project.get("dependencies", [])
-
-        if project_path.exists():
-            extractor.analyze_project(project_path, dependencies)
-        else:
-            print(f"   ⚠️  Path not found: {project_path}")
+    extractor.analyze_all_projects(downloaded_projects)
 
     # 자주 등장하는 패턴 추출
     print(f"\n📊 Analyzing frequency...")
@@ -6,6 +6,21 @@ from pathlib import Path
 from typing import Dict, List
 from config import Config
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _unique_sorted_names(entries: List[Dict]) -> List[str]:
+    """패턴 항목에서 중복 없는 이름 목록을 정렬해 반환 (규칙 where 절 크기 최소화)"""
+    return sorted({entry["name"] for entry in entries})
+
 
 class RuleGenerator:
     """추출된 패턴으로부터 YAML 규칙 자동 생성"""
@@ -27,7 +42,7 @@ class RuleGenerator:
 
         # 1. 자주 사용되는 프로퍼티 이름
         if patterns["property_names"]:
-            property_names = [p["name"] for p in patterns["property_names"]]
+            property_names = _unique_sorted_names(patterns["property_names"])
 
             rules.append({
                 "id": "LEARNED_COMMON_PROPERTY_NAMES",
@@ -43,7 +58,7 @@ class RuleGenerator:
 
         # 2. 자주 사용되는 메서드 이름
         if patterns["method_names"]:
-            method_names = [m["name"] for m in patterns["method_names"]]
+            method_names = _unique_sorted_names(patterns["method_names"])
 
             rules.append({
                 "id": "LEARNED_COMMON_METHOD_NAMES",
@@ -76,7 +91,7 @@ class RuleGenerator:
 
         # 4. 델리게이트 메서드
         if patterns["delegate_methods"]:
-            delegate_methods = [d["name"] for d in patterns["delegate_methods"]]
+            delegate_methods = _unique_sorted_names(patterns["delegate_methods"])
 
             rules.append({
                 "id": "LEARNED_DELEGATE_METHODS",
@@ -132,7 +147,7 @@ class RuleGenerator:
             return generated_rules
 
         with open(existing_rules_path, "r", encoding="utf-8") as f:
-            existing_data = yaml.safe_load(f)
+            existing_data = yaml.load(f, Loader=SafeLoader)
             existing_rules = existing_data.get("rules", [])
 
         print(f"   📋 Existing rules: {len(existing_rules)}")
@@ -166,7 +181,7 @@ class RuleGenerator:
         output = {"rules": rules}
 
         with open(output_path, "w", encoding="utf-8") as f:
-            yaml.dump(output, f, allow_unicode=True, sort_keys=False, width=120)
+            yaml.dump(output, f, Dumper=SafeDumper, allow_unicode=True, sort_keys=False, width=120)
 
         print(f"💾 Saved {len(rules)} rules to {output_path}")
 
@@ -182,15 +197,16 @@ class RuleGenerator:
 
         for rule in rules:
             # 카테고리별 (ID 접두사 기준)
-            category = rule["id"].split("_")[0]
+            category = rule["id"].partition("_")[0]
             stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
 
             # 타겟별 (find.target 기준)
-            try:
-                target = rule["pattern"][0]["find"]["target"]
+            pattern = rule.get("pattern")
+            if not pattern or not isinstance(pattern[0], dict):
+                continue
+            target = pattern[0].get("find", {}).get("target")
+            if target is not None:
                 stats["by_target"][target] = stats["by_target"].get(target, 0) + 1
-            except:
-                pass
 
         return stats
 
@@ -208,8 +224,11 @@ def main():
         return
 
     print(f"\n📂 Loading patterns from {patterns_file}")
-    with open(patterns_file, "r", encoding="utf-8") as f:
-        patterns = json.load(f)
+    if orjson is not None:
+        patterns = orjson.loads(patterns_file.read_bytes())
+    else:
+        with open(patterns_file, "r", encoding="utf-8") as f:
+            patterns = json.load(f)
 
     # 규칙 생성
     print("\n🔨 Generating rules...")
@@ -3,10 +3,16 @@
 import json
 import yaml
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 from config import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # python-engine 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent / "python-engine"))
 
@@ -55,19 +61,28 @@ class RuleValidator:
             }
         }
 
+        # 규칙은 모든 벤치마크에서 동일하므로 한 번만 로드
+        rules = RuleLoader(str(rules_path)).rules
+
         results = {}
 
         for project_name, paths in benchmark_projects.items():
-            if not paths["symbol_graph"].exists() or not paths["ground_truth"].exists():
-                print(f"   ⚠️  {project_name}: Files not found, skipping")
+            # 정답 파일이 없으면 심볼 그래프를 로드하기 전에 건너뜀
+            try:
+                ground_truth = self._load_ground_truth(paths["ground_truth"])
+            except FileNotFoundError as e:
+                print(f"   ⚠️  {project_name}: Files not found, skipping: {e.filename}")
+                continue
+            except (OSError, UnicodeDecodeError) as e:
+                # 읽을 수 없는 정답 파일 하나 때문에 전체 검증을 중단하지 않음
+                print(f"   ❌ {project_name}: Cannot read ground truth, skipping: {e}")
                 continue
-
-            print(f"\n   📊 Testing: {project_name}")
 
             result = self._validate_single_project(
-                rules_path,
+                project_name,
+                rules,
                 paths["symbol_graph"],
-                paths["ground_truth"]
+                ground_truth
             )
 
             if result:
@@ -104,21 +119,24 @@ class RuleValidator:
 
         return {}
 
+    @staticmethod
+    def _load_ground_truth(ground_truth_path: Path) -> Set[str]:
+        """정답 로드 (한 줄에 심볼 이름 하나 → 공백 분리로 한 번에 파싱)"""
+        return set(ground_truth_path.read_text(encoding="utf-8").split())
+
     def _validate_single_project(
             self,
-            rules_path: Path,
+            project_name: str,
+            rules: List[Dict],
             symbol_graph_path: Path,
-            ground_truth_path: Path
+            ground_truth: Set[str]
     ) -> Dict:
         """단일 프로젝트 검증"""
 
         try:
             # ✅ 심볼 그래프 로드
             symbol_graph = SymbolGraph(str(symbol_graph_path))
-
-            # ✅ 규칙 로드 (RuleLoader의 올바른 사용법)
-            rule_loader = RuleLoader(str(rules_path))
-            rules = rule_loader.rules  # ← load_rules() 대신 .rules 속성 사용
+            print(f"\n   📊 Testing: {project_name}")
 
             # ✅ 패턴 매칭
             # [수정 1] 생성자에는 symbol_graph만 전달합니다.
@@ -126,35 +144,35 @@ class RuleValidator:
             # [수정 2] find_matches 메서드에 rules를 인자로 전달합니다.
             excluded_node_ids = matcher.find_matches(rules)
 
-            # ✅ 노드 ID를 심볼 이름으로 변환
+            # ✅ 노드 ID를 심볼 이름으로 변환 (노드 뷰를 한 번만 참조)
+            # 엣지로만 생긴 속성 없는 노드는 심볼이 아니므로 제외
+            nodes = symbol_graph.graph.nodes
             predicted = set()
             for node_id in excluded_node_ids:
-                node_data = symbol_graph.get_node(node_id)
+                node_data = nodes.get(node_id)
                 if node_data:
                     predicted.add(node_data.get('name', node_id))
 
-            # 정답 로드
-            with open(ground_truth_path, "r", encoding="utf-8") as f:
-                ground_truth = {line.strip() for line in f if line.strip()}
-
-            # 전체 심볼 수
-            total_symbols = len(symbol_graph.find_all_nodes())
+            # 전체 심볼 수 (노드 리스트를 만들지 않고 개수만 조회)
+            total_symbols = len(nodes)
 
             # 메트릭 계산
+            predicted_count = len(predicted)
+            ground_truth_count = len(ground_truth)
             true_positive = len(predicted & ground_truth)
-            false_positive = len(predicted - ground_truth)
-            false_negative = len(ground_truth - predicted)
+            false_positive = predicted_count - true_positive
+            false_negative = ground_truth_count - true_positive
             true_negative = total_symbols - true_positive - false_positive - false_negative
 
             accuracy = (true_positive + true_negative) / total_symbols if total_symbols > 0 else 0
-            precision = true_positive / len(predicted) if len(predicted) > 0 else 0
-            recall = true_positive / len(ground_truth) if len(ground_truth) > 0 else 0
+            precision = true_positive / predicted_count if predicted_count > 0 else 0
+            recall = true_positive / ground_truth_count if ground_truth_count > 0 else 0
             f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
 
             return {
                 "total_symbols": total_symbols,
-                "ground_truth_count": len(ground_truth),
-                "predicted_count": len(predicted),
+                "ground_truth_count": ground_truth_count,
+                "predicted_count": predicted_count,
                 "true_positive": true_positive,
                 "false_positive": false_positive,
                 "false_negative": false_negative,
@@ -162,9 +180,15 @@ class RuleValidator:
                 "precision": precision,
                 "recall": recall,
                 "f1_score": f1_score,
-                "missing_identifiers": list(ground_truth - predicted)[:10]
+                # 보고서에는 예시 10개만 필요하므로 차집합 전체를 만들지 않음
+                "missing_identifiers": list(islice((x for x in ground_truth if x not in predicted), 10))
             }
 
+        except FileNotFoundError as e:
+            # 심볼 그래프 파일이 없으면 여기서 건너뜀
+            print(f"   ⚠️  {project_name}: Files not found, skipping: {e.filename}")
+            return None
+
         except Exception as e:
             print(f"      ❌ Error: {e}")
             import traceback
@@ -204,8 +228,12 @@ class RuleValidator:
         """검증 결과 저장"""
         output_path = Config.DATA_DIR / filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
 
         print(f"\n💾 Validation report saved to {output_path}")
 
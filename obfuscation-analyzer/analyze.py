@@ -8,8 +8,11 @@ CLI 도구 - 난독화 제외 대상 분석
 """
 
 import argparse
+import os
+import re
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
 import json
 
@@ -21,15 +24,24 @@ from lib.analyzer.analysis_engine import AnalysisEngine
 from lib.analyzer.rule_loader import RuleLoader
 from lib.utils.report_generator import ReportGenerator
 
+# 프로젝트 파일 탐색 시 내려가지 않을 디렉토리 (의존성/빌드 산출물)
+_SKIP_DIRS = {'.git', 'Pods', 'Carthage', 'DerivedData', '.build', 'build', 'node_modules'}
+
+# Package.swift의 name: "ProjectName" 패턴
+_PKG_NAME_RE = re.compile(r'name:\s*"([^"]+)"')
+
 
 class ObfuscationAnalyzer:
     """난독화 분석 오케스트레이터"""
 
-    def __init__(self, project_path: Path, output_dir: Path = None, debug: bool = False):
+    def __init__(self, project_path: Path, output_dir: Path = None, debug: bool = False, jobs: int = 1):
         self.project_path = Path(project_path)
         self.output_dir = output_dir or Path("./analysis_output")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.debug = debug
+        self.jobs = jobs
+        # Step 3에서 로드한 심볼 그래프 (Step 4 리포트에서 재사용)
+        self.graph = None
 
         # 내부 경로
         self.bin_dir = Path(__file__).parent / "bin"
@@ -83,6 +95,7 @@ class ObfuscationAnalyzer:
         all_identifiers = set()
 
         # 1-1. 헤더 스캔
+        # (두 스캐너 모두 진행 상황을 stdout 에 출력하므로 출력이 섞이지 않도록 순서대로 실행)
         print("  → Scanning Objective-C headers...")
         header_scanner = HeaderScanner(
             self.project_path,
@@ -94,10 +107,10 @@ class ObfuscationAnalyzer:
         all_identifiers.update(header_ids)
         print(f"     Found {len(header_ids)} identifiers from headers")
 
-        # 1-2. 리소스 스캔
+        # 1-2. 리소스 스캔 (jobs > 1 이면 파일 파싱을 프로세스 풀로 분산)
         print("  → Scanning resource files...")
-        resource_scanner = ResourceScanner(self.project_path)
-        resource_scanner.scan_all()
+        resource_scanner = ResourceScanner(self.project_path, verbose=self.debug)
+        resource_scanner.scan_all(self.jobs)
         resource_ids = resource_scanner.get_all_identifiers()
         all_identifiers.update(resource_ids)
         print(f"     Found {len(resource_ids)} identifiers from resources")
@@ -105,8 +118,11 @@ class ObfuscationAnalyzer:
         # 저장
         external_file = self.output_dir / "external_identifiers.txt"
         with open(external_file, 'w', encoding='utf-8') as f:
-            for identifier in sorted(all_identifiers):
-                f.write(identifier + '\n')
+            # 한 줄에 하나씩, 한 번의 write로 기록
+            # SymbolExtractor는 Set으로 읽으므로 순서 무관 → 파일이 남는 디버그 모드에서만 정렬
+            if all_identifiers:
+                identifiers = sorted(all_identifiers) if self.debug else all_identifiers
+                f.write('\n'.join(identifiers) + '\n')
 
         return all_identifiers
 
@@ -136,11 +152,14 @@ class ObfuscationAnalyzer:
             "--external-exclusion-list", str(external_file)
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # stderr는 버퍼에 모으지 않고 실행 중에 바로 출력 (stdout은 사용하지 않음)
+        with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True) as proc:
+            for line in proc.stderr:
+                print(line, end='')
+            returncode = proc.wait()
 
-        if result.returncode != 0:
-            print("❌ SymbolExtractor failed:")
-            print(result.stderr)
+        if returncode != 0:
+            print("❌ SymbolExtractor failed")
             sys.exit(1)
 
         print(f"  → Symbol graph saved to: {symbol_graph_path.name}")
@@ -160,8 +179,9 @@ class ObfuscationAnalyzer:
 
         # 분석 실행
         engine = AnalysisEngine(graph, rules)
-        engine.run()
+        engine.run(jobs=self.jobs)
 
+        self.graph = graph
         return engine.get_results()
 
     def _generate_reports(self, results: list):
@@ -176,8 +196,8 @@ class ObfuscationAnalyzer:
         txt_path = self.output_dir / "exclusion_list.txt"
         reporter.generate_txt(results, str(txt_path))
 
-        # 콘솔 요약
-        graph = SymbolGraph(str(self.output_dir / "symbol_graph.json"))
+        # 콘솔 요약 (Step 3의 그래프 재사용, 없을 때만 다시 로드)
+        graph = self.graph or SymbolGraph(str(self.output_dir / "symbol_graph.json"))
         reporter.print_summary(results, graph)
 
     def _find_project_name(self) -> str:
@@ -192,18 +212,9 @@ class ObfuscationAnalyzer:
 
         # 3. 디렉토리라면 재귀적으로 .xcodeproj 또는 .xcworkspace 찾기
         if self.project_path.is_dir():
-            # .xcodeproj 재귀 검색 (rglob)
-            xcodeproj_files = list(self.project_path.rglob("*.xcodeproj"))
-            if xcodeproj_files:
-                # 가장 얕은 깊이의 프로젝트 선택
-                xcodeproj_files.sort(key=lambda p: len(p.relative_to(self.project_path).parts))
-                return xcodeproj_files[0].stem
-
-            # .xcworkspace 재귀 검색
-            xcworkspace_files = list(self.project_path.rglob("*.xcworkspace"))
-            if xcworkspace_files:
-                xcworkspace_files.sort(key=lambda p: len(p.relative_to(self.project_path).parts))
-                return xcworkspace_files[0].stem
+            project_file_name = self._walk_for_project(self.project_path)
+            if project_file_name:
+                return project_file_name
 
             # Package.swift 검색 (현재 디렉토리만)
             package_swift = self.project_path / "Package.swift"
@@ -213,8 +224,7 @@ class ObfuscationAnalyzer:
                     with open(package_swift, 'r', encoding='utf-8') as f:
                         content = f.read()
                         # name: "ProjectName" 패턴 찾기
-                        import re
-                        match = re.search(r'name:\s*"([^"]+)"', content)
+                        match = _PKG_NAME_RE.search(content)
                         if match:
                             return match.group(1)
                 except:
@@ -225,6 +235,38 @@ class ObfuscationAnalyzer:
         # 찾지 못하면 디렉토리 이름 사용
         return self.project_path.name
 
+    @staticmethod
+    def _walk_for_project(root: Path) -> str:
+        """
+        한 번의 BFS로 가장 얕은 .xcodeproj 이름 반환 (없으면 가장 얕은 .xcworkspace, 둘 다 없으면 None)
+
+        BFS이므로 처음 찾은 .xcodeproj가 가장 얕은 것 → 즉시 종료
+        """
+        shallowest_workspace = None
+        queue = deque([root])
+
+        while queue:
+            current = queue.popleft()
+            try:
+                entries = sorted(os.scandir(current), key=lambda e: e.name)
+            except OSError:
+                continue
+
+            for entry in entries:
+                name = entry.name
+                if name.endswith('.xcodeproj'):
+                    return name[:-len('.xcodeproj')]
+                if name.endswith('.xcworkspace'):
+                    if shallowest_workspace is None:
+                        shallowest_workspace = name[:-len('.xcworkspace')]
+                    continue
+                if name in _SKIP_DIRS or name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    queue.append(entry.path)
+
+        return shallowest_workspace
+
     def _cleanup_intermediate_files(self):
         """디버그 모드가 아닐 때 중간 파일 삭제 (exclusion_list.txt만 유지)"""
         print("\n🧹 Cleaning up intermediate files...")
@@ -294,6 +336,13 @@ def main():
         help="디버그 모드: 모든 중간 파일 보존"
     )
 
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="규칙 매칭과 리소스 파일 파싱에 사용할 워커 프로세스 수 (기본: 1 = 순차 실행)"
+    )
+
     args = parser.parse_args()
 
     # 프로젝트 존재 확인
@@ -305,7 +354,8 @@ def main():
     analyzer = ObfuscationAnalyzer(
         project_path=args.project_path,
         output_dir=args.output,
-        debug=args.debug
+        debug=args.debug,
+        jobs=args.jobs
     )
 
     analyzer.run_full_analysis(real_project_name=args.project_name)
@@ -1,18 +1,40 @@
 import json
 import networkx as nx
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class SymbolGraph:
     """JSON 파일로부터 심볼 그래프를 로드하고 쿼리 헬퍼를 제공합니다."""
 
+    # 값 → 노드 ID 역인덱스를 만들어 두는 속성 (규칙의 == / in 리터럴 조건 선필터용)
+    INDEXED_PROPERTIES = ('kind', 'name')
+
     def __init__(self, json_path: str):
+        self.json_path = json_path
         self.graph = nx.DiGraph()
+        self._by_prop: Dict[str, Dict[str, Set[str]]] = {prop: {} for prop in self.INDEXED_PROPERTIES}
+        # (edge_type, direction) → 해당 엣지를 하나 이상 가진 노드 ID 집합 (edge_type None = 모든 타입)
+        self._nodes_with_edge: Dict[tuple, frozenset] = {}
+        # (edge_type, direction) → {노드 ID: 이웃 노드 ID frozenset}
+        self._adjacency: Dict[tuple, Dict[str, frozenset]] = {}
+        # 엣지 타입 튜플 → {노드 ID: 자신 포함 상위 타입 전체} (처음 요청될 때 계산)
+        self._ancestor_closures: Dict[tuple, Dict[str, frozenset]] = {}
         self._load_from_json(json_path)
+        self._build_property_index()
+        self._build_edge_indexes()
 
     def _load_from_json(self, json_path: str):
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(json_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         for symbol_data in data.get('symbols', []):
             self.graph.add_node(symbol_data['id'], **symbol_data)
@@ -24,6 +46,37 @@ class SymbolGraph:
                 type=edge_data['type']
             )
 
+    def _build_property_index(self):
+        """INDEXED_PROPERTIES의 문자열 값 → 노드 ID 집합 인덱스 생성"""
+        for node_id, data in self.graph.nodes(data=True):
+            for prop, index in self._by_prop.items():
+                value = data.get(prop)
+                if isinstance(value, str):
+                    index.setdefault(value, set()).add(node_id)
+
+    def _build_edge_indexes(self):
+        """
+        엣지 타입/방향별 인덱스 생성 (중복 엣지로 타입이 덮어써진 최종 그래프 기준)
+
+        - _nodes_with_edge: 엣지가 하나 이상 있는 노드 집합 (edge_type None = 모든 타입)
+        - _adjacency: 노드별 이웃 집합
+        """
+        presence: Dict[tuple, Set[str]] = {}
+        adjacency: Dict[tuple, Dict[str, Set[str]]] = {}
+        for u, v, data in self.graph.edges(data=True):
+            edge_type = data.get('type')
+            for key_type in (edge_type, None):
+                presence.setdefault((key_type, 'out'), set()).add(u)
+                presence.setdefault((key_type, 'in'), set()).add(v)
+            adjacency.setdefault((edge_type, 'out'), {}).setdefault(u, set()).add(v)
+            adjacency.setdefault((edge_type, 'in'), {}).setdefault(v, set()).add(u)
+
+        self._nodes_with_edge = {key: frozenset(nodes) for key, nodes in presence.items()}
+        self._adjacency = {
+            key: {node_id: frozenset(neighbors) for node_id, neighbors in by_node.items()}
+            for key, by_node in adjacency.items()
+        }
+
     def get_node(self, node_id: str) -> Dict[str, Any]:
         """노드 ID로 노드 데이터를 반환합니다."""
         if node_id not in self.graph:
@@ -34,6 +87,63 @@ class SymbolGraph:
         """모든 노드 ID 리스트를 반환합니다."""
         return list(self.graph.nodes)
 
+    def find_nodes_by_kind(self, kinds: Iterable[str]) -> Set[str]:
+        """주어진 kind 중 하나에 해당하는 노드 ID 집합을 반환합니다. (새 집합)"""
+        return self.find_nodes_by_property('kind', kinds)
+
+    def find_nodes_by_property(self, prop: str, values: Iterable[str]) -> Set[str]:
+        """인덱스된 속성 값이 주어진 값 중 하나인 노드 ID 집합을 반환합니다. (새 집합)"""
+        index = self._by_prop[prop]
+        result = set()
+        for value in values:
+            result.update(index.get(value, ()))
+        return result
+
+    def find_nodes_with_edge(self, edge_type: str = None, direction: str = 'out') -> frozenset:
+        """특정 타입(None이면 모든 타입)의 엣지를 해당 방향으로 하나 이상 가진 노드 ID 집합을 반환합니다."""
+        return self._nodes_with_edge.get((edge_type, 'out' if direction == 'out' else 'in'), frozenset())
+
+    def ancestor_closure(self, edge_types: Tuple[str, ...]) -> Dict[str, frozenset]:
+        """
+        주어진 타입의 out 엣지로 도달 가능한 모든 노드(자기 자신 포함)를 노드별로 반환합니다.
+
+        상속 순환이 있어도 되도록 강연결요소 단위로 묶어 역위상 순서로 한 번만 계산하고,
+        같은 요소의 노드끼리는 같은 frozenset을 공유합니다.
+        """
+        closure = self._ancestor_closures.get(edge_types)
+        if closure is not None:
+            return closure
+
+        inheritance = nx.DiGraph()
+        inheritance.add_nodes_from(self.graph)
+        inheritance.add_edges_from(
+            (u, v) for u, v, data in self.graph.edges(data=True) if data.get('type') in edge_types
+        )
+
+        condensed = nx.condensation(inheritance)
+        closure_by_component = {}
+        for component in reversed(list(nx.topological_sort(condensed))):
+            members = frozenset(condensed.nodes[component]['members'])
+            closure_by_component[component] = members.union(
+                *(closure_by_component[successor] for successor in condensed.successors(component))
+            )
+
+        mapping = condensed.graph['mapping']
+        closure = {node_id: closure_by_component[mapping[node_id]] for node_id in inheritance}
+        self._ancestor_closures[edge_types] = closure
+        return closure
+
+    def get_neighbors_bulk(self, node_ids: Iterable[str], edge_types: Iterable[str], direction: str = 'out') -> Set[str]:
+        """여러 노드의 이웃(주어진 엣지 타입들)을 한 번에 모아 반환합니다."""
+        direction = 'out' if direction == 'out' else 'in'
+        node_ids = tuple(node_ids)
+        result = set()
+        for edge_type in edge_types:
+            adjacency = self._adjacency.get((edge_type, direction))
+            if adjacency:
+                result.update(*(adjacency.get(node_id, ()) for node_id in node_ids))
+        return result
+
     def get_neighbors(self, node_id: str, edge_type: str = None, direction: str = 'out'):
         """특정 엣지 타입으로 연결된 이웃 노드를 찾습니다."""
         neighbors = []
@@ -2,6 +2,11 @@ import yaml
 import sys
 from typing import List, Dict, Any
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class RuleLoader:
     """YAML 규칙 파일을 로드하고 유효성을 검사합니다."""
@@ -13,7 +18,7 @@ class RuleLoader:
         """YAML 파일에서 규칙을 로드합니다."""
         try:
             with open(yaml_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
 
             if not isinstance(data, dict) or 'rules' not in data:
                 print(f"❌ Error: YAML 파일은 'rules' 키를 포함해야 합니다: {yaml_path}", file=sys.stderr)
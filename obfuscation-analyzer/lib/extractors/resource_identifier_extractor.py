@@ -4,15 +4,88 @@ iOS/macOS 리소스 파일에서 식별자 추출기 (최종 완성 버전 v3)
 XIB, Storyboard, Plist, CoreData, Strings, Entitlements, Assets에서 난독화 제외 대상 추출
 """
 
+import os
 import re
 import json
 import argparse
 import plistlib
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Set, Dict, List, Optional
 from collections import defaultdict
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# XIB/Storyboard 에서 제외할 시스템 클래스
+SYSTEM_CLASSES = frozenset({
+    'UIResponder', 'UIViewController', 'UIView', 'UITableView',
+    'UICollectionView', 'UIButton', 'UILabel', 'UIImageView',
+    'UITableViewCell', 'UICollectionViewCell', 'UIScrollView',
+    'UIStackView', 'UINavigationController', 'UITabBarController',
+    'NSObject', 'NSManagedObject', 'UITextField', 'UITextView',
+    'UISwitch', 'UISlider', 'UISegmentedControl', 'UIDatePicker',
+    'UIPickerView', 'UIActivityIndicatorView', 'UIProgressView',
+    'NSLayoutConstraint', 'UILayoutGuide'
+})
+
+# Assets 카탈로그의 시스템 예약어
+ASSET_RESERVED_NAMES = frozenset({'Contents', 'Info', 'Metadata'})
+
+# 식별자 검증용 정규식 (호출마다 문자 단위 루프/집합 생성을 하지 않도록 모듈 레벨에서 한 번만 컴파일)
+# \w 는 str.isalnum() 또는 '_' 와 동일한 문자 집합
+_WORD_RE = re.compile(r'\w+')
+_WORD_OR_HYPHEN_RE = re.compile(r'[\w-]+')
+_SYMBOL_NAME_RE = re.compile(r'[\w.-]+')
+# .strings 는 바이트 단위로 스캔하고 매치된 키만 디코딩
+_STRINGS_ENTRY_RE = re.compile(rb'^"([^"]+)"\s*=\s*"[^"]*"\s*;', re.MULTILINE)
+_LOCALIZATION_KEY_RE = re.compile(r'[A-Za-z0-9_-][A-Za-z0-9._ -]*')
+_ENTITLEMENT_ID_RE = re.compile(r'[A-Za-z$][A-Za-z0-9._$()-]*')
+_DOMAIN_HOST_RE = re.compile(r'[A-Za-z0-9.-]+')
+
+
+def _is_valid_xib_identifier(name: str) -> bool:
+    """XIB/Storyboard 의 일반 식별자인지 검사 (길이 미달은 캐시 전에 걸러냄)"""
+    if not name or len(name) <= 1:
+        return False
+    return _check_xib_identifier(name)
+
+
+@lru_cache(maxsize=4096)
+def _check_xib_identifier(name: str) -> bool:
+    # 같은 클래스/아울렛 이름이 파일 전반에 반복되므로 검증 결과를 캐시
+    # ✅ 하이픈(-) 허용 (Asset 이름에 사용됨)
+    # 첫 글자: 영문자 또는 언더스코어
+    if not (name[0].isalpha() or name[0] == '_'):
+        return False
+
+    # 나머지: 영문자, 숫자, 언더스코어, 하이픈
+    return _WORD_OR_HYPHEN_RE.fullmatch(name) is not None
+
+
+def _release_element(elem):
+    """iterparse 로 처리가 끝난 요소와 (lxml 이면) 앞선 형제 요소를 해제"""
+    elem.clear()
+    if hasattr(elem, 'getprevious'):
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _parse_xml(file_path: Path):
+    """XML 트리 파싱 (lxml 은 주석/PI 를 자식 노드로 남기므로 xml.etree 와 같게 제거)"""
+    if hasattr(ET, 'LXML_VERSION'):
+        return ET.parse(str(file_path), ET.XMLParser(remove_comments=True, remove_pis=True))
+    return ET.parse(str(file_path))
 
 
 class AssetsParser:
@@ -21,9 +94,15 @@ class AssetsParser:
     @classmethod
     def parse(cls, assets_path: Path) -> Dict[str, Set[str]]:
         result = defaultdict(set)
+        cls.parse_into(assets_path, result)
+        return result
+
+    @classmethod
+    def parse_into(cls, assets_path: Path, result: Dict[str, Set[str]]):
+        """파싱 결과를 result(카테고리 → 식별자 집합)에 바로 기록"""
 
         if not assets_path.is_dir():
-            return dict(result)
+            return
 
         try:
             # .imageset, .colorset, .dataset 등 찾기
@@ -81,8 +160,6 @@ class AssetsParser:
         except Exception:
             pass
 
-        return dict(result)
-
     @staticmethod
     def _is_valid_asset_name(name: str) -> bool:
         """유효한 Asset 이름인지 검사"""
@@ -90,11 +167,7 @@ class AssetsParser:
             return False
 
         # Assets은 거의 모든 문자 허용하지만, 시스템 예약어 제외
-        system_reserved = {
-            'Contents', 'Info', 'Metadata'
-        }
-
-        if name in system_reserved:
+        if name in ASSET_RESERVED_NAMES:
             return False
 
         return True
@@ -103,151 +176,93 @@ class AssetsParser:
 class XIBStoryboardParser:
     """XIB/Storyboard 파일에서 식별자 추출 (개선됨)"""
 
-    # 제외할 시스템 클래스
-    SYSTEM_CLASSES = {
-        'UIResponder', 'UIViewController', 'UIView', 'UITableView',
-        'UICollectionView', 'UIButton', 'UILabel', 'UIImageView',
-        'UITableViewCell', 'UICollectionViewCell', 'UIScrollView',
-        'UIStackView', 'UINavigationController', 'UITabBarController',
-        'NSObject', 'NSManagedObject', 'UITextField', 'UITextView',
-        'UISwitch', 'UISlider', 'UISegmentedControl', 'UIDatePicker',
-        'UIPickerView', 'UIActivityIndicatorView', 'UIProgressView',
-        'NSLayoutConstraint', 'UILayoutGuide'
-    }
-
     @classmethod
     def parse(cls, file_path: Path) -> Dict[str, Set[str]]:
         result = defaultdict(set)
+        cls.parse_into(file_path, result)
+        return result
 
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+    @classmethod
+    def parse_into(cls, file_path: Path, result: Dict[str, Set[str]]):
+        """파싱 결과를 result(카테고리 → 식별자 집합)에 바로 기록"""
 
-            # Custom Class 이름 추출
-            for elem in root.iter():
-                custom_class = elem.get('customClass')
-                if custom_class and cls._is_valid_class(custom_class):
-                    result['classes'].add(custom_class)
-
-                custom_module = elem.get('customModule')
-                if custom_module and cls._is_valid_identifier(custom_module):
-                    result['modules'].add(custom_module)
-
-            # IBOutlet/IBAction connections
-            for connection in root.iter('connection'):
-                kind = connection.get('kind')
-                property_name = connection.get('property')
-
-                if kind == 'outlet' and property_name:
-                    if cls._is_valid_identifier(property_name):
-                        result['outlets'].add(property_name)
-                elif kind == 'action':
-                    selector = connection.get('selector')
-                    if selector and cls._is_valid_selector(selector):
-                        result['actions'].add(selector)
-
-            # Segue identifiers
-            for segue in root.iter('segue'):
-                identifier = segue.get('identifier')
-                if identifier and cls._is_valid_identifier(identifier):
-                    result['segue_identifiers'].add(identifier)
-
-            # Reuse identifiers
-            for elem in root.iter():
-                reuse_id = elem.get('reuseIdentifier')
-                if reuse_id and cls._is_valid_identifier(reuse_id):
-                    result['reuse_identifiers'].add(reuse_id)
-
-                storyboard_id = elem.get('storyboardIdentifier')
-                if storyboard_id and cls._is_valid_identifier(storyboard_id):
-                    result['storyboard_identifiers'].add(storyboard_id)
-
-                restoration_id = elem.get('restorationIdentifier')
-                if restoration_id and cls._is_valid_identifier(restoration_id):
-                    result['restoration_identifiers'].add(restoration_id)
-
-            # ✅ 이미지 이름 추출 추가
-            for elem in root.iter('image'):
-                # <image name="logo-evolution-splash"/> 형태
-                image_name = elem.get('name')
-                if image_name and cls._is_valid_identifier(image_name):
-                    result['image_names'].add(image_name)
-
-            # ✅ SF Symbols (systemName) 추출 추가
-            for elem in root.iter():
-                system_name = elem.get('systemName')
-                if system_name:
-                    # SF Symbol은 점(.)을 포함할 수 있음
-                    if cls._is_valid_symbol_name(system_name):
-                        result['system_symbols'].add(system_name)
-
-            # ✅ 나머지 이미지 참조 (imageView 등)
-            for elem in root.iter('imageView'):
-                image = elem.get('image')
-                if image and cls._is_valid_identifier(image):
-                    result['image_names'].add(image)
-
-            for elem in root.iter('button'):
-                image = elem.get('image')
-                if image and cls._is_valid_identifier(image):
-                    result['image_names'].add(image)
-
-            # User Defined Runtime Attributes (keyPath)
-            for attr in root.iter('userDefinedRuntimeAttribute'):
-                keypath = attr.get('keyPath')
-                if keypath:
-                    parts = keypath.split('.')
-                    for part in parts:
-                        if cls._is_valid_identifier(part):
-                            result['runtime_attributes'].add(part)
-
-            # ✅ Scene/View 레이어 이름 추출 (label 속성)
-            for elem in root.iter():
-                label = elem.get('label')
-                if label and cls._is_scene_label(label):
-                    result['scene_labels'].add(label)
+        try:
+            # DOM 전체를 만들고 여러 번 순회하는 대신, 한 번의 스트리밍 순회로 모든 항목 추출
+            for _, elem in ET.iterparse(str(file_path), events=('end',)):
+                tag = elem.tag
+                get = elem.attrib.get
+
+                # 공통 식별자 속성 (customClass, reuseIdentifier, systemName, label 등)은
+                # 속성마다 get() 을 호출하지 않고 요소의 속성을 한 번 훑으며 테이블로 분기
+                for attr_name, value in elem.attrib.items():
+                    handler = _XIB_ATTR_HANDLERS.get(attr_name)
+                    if handler is not None and value:
+                        is_valid, category = handler
+                        if is_valid(value):
+                            result[category].add(value)
+
+                # IBOutlet/IBAction connections
+                if tag == 'connection':
+                    kind = get('kind')
+                    property_name = get('property')
+
+                    if kind == 'outlet' and property_name:
+                        if _is_valid_xib_identifier(property_name):
+                            result['outlets'].add(property_name)
+                    elif kind == 'action':
+                        selector = get('selector')
+                        if selector and cls._is_valid_selector(selector):
+                            result['actions'].add(selector)
+
+                # Segue identifiers
+                elif tag == 'segue':
+                    identifier = get('identifier')
+                    if identifier and _is_valid_xib_identifier(identifier):
+                        result['segue_identifiers'].add(identifier)
+
+                # ✅ 이미지 이름 추출 추가
+                elif tag == 'image':
+                    # <image name="logo-evolution-splash"/> 형태
+                    image_name = get('name')
+                    if image_name and _is_valid_xib_identifier(image_name):
+                        result['image_names'].add(image_name)
+
+                # ✅ 나머지 이미지 참조 (imageView 등)
+                elif tag == 'imageView' or tag == 'button':
+                    image = get('image')
+                    if image and _is_valid_xib_identifier(image):
+                        result['image_names'].add(image)
+
+                # User Defined Runtime Attributes (keyPath)
+                elif tag == 'userDefinedRuntimeAttribute':
+                    keypath = get('keyPath')
+                    if keypath:
+                        parts = keypath.split('.')
+                        for part in parts:
+                            if _is_valid_xib_identifier(part):
+                                result['runtime_attributes'].add(part)
+
+                # 처리가 끝난 요소는 비워서 큰 스토리보드의 메모리 사용량을 억제
+                _release_element(elem)
 
         except Exception:
+            # 스트리밍 파싱이므로 오류 지점 이전에 읽은 식별자는 유지됨
             pass
 
-        return dict(result)
-
     @classmethod
     def _is_valid_class(cls, name: str) -> bool:
         """유효한 클래스명인지 검사"""
         if not name or len(name) <= 1:
             return False
 
-        if name in cls.SYSTEM_CLASSES:
+        if name in SYSTEM_CLASSES:
             return False
 
         # 대문자로 시작하는 영문자+숫자+언더스코어
         if not name[0].isupper():
             return False
 
-        for char in name:
-            if not (char.isalnum() or char == '_'):
-                return False
-
-        return True
-
-    @classmethod
-    def _is_valid_identifier(cls, name: str) -> bool:
-        """유효한 일반 식별자인지 검사"""
-        if not name or len(name) <= 1:
-            return False
-
-        # ✅ 하이픈(-) 허용 (Asset 이름에 사용됨)
-        # 첫 글자: 영문자 또는 언더스코어
-        if not (name[0].isalpha() or name[0] == '_'):
-            return False
-
-        # 나머지: 영문자, 숫자, 언더스코어, 하이픈
-        for char in name:
-            if not (char.isalnum() or char in ('_', '-')):
-                return False
-
-        return True
+        return _WORD_RE.fullmatch(name) is not None
 
     @classmethod
     def _is_valid_symbol_name(cls, name: str) -> bool:
@@ -261,11 +276,7 @@ class XIBStoryboardParser:
             return False
 
         # 허용: 영문자, 숫자, 점, 언더스코어, 하이픈
-        for char in name:
-            if not (char.isalnum() or char in ('.', '_', '-')):
-                return False
-
-        return True
+        return _SYMBOL_NAME_RE.fullmatch(name) is not None
 
     @classmethod
     def _is_scene_label(cls, label: str) -> bool:
@@ -299,12 +310,25 @@ class XIBStoryboardParser:
 
         # 각 파트가 유효한 식별자인지 확인
         for part in parts:
-            if part and not cls._is_valid_identifier(part):
+            if part and not _is_valid_xib_identifier(part):
                 return False
 
         return True
 
 
+# XIB/Storyboard 요소의 공통 속성 → (검증 함수, 결과 카테고리)
+# SF Symbol(systemName)은 점(.)을 포함할 수 있음
+_XIB_ATTR_HANDLERS = {
+    'customClass': (XIBStoryboardParser._is_valid_class, 'classes'),
+    'customModule': (_is_valid_xib_identifier, 'modules'),
+    'reuseIdentifier': (_is_valid_xib_identifier, 'reuse_identifiers'),
+    'storyboardIdentifier': (_is_valid_xib_identifier, 'storyboard_identifiers'),
+    'restorationIdentifier': (_is_valid_xib_identifier, 'restoration_identifiers'),
+    'systemName': (XIBStoryboardParser._is_valid_symbol_name, 'system_symbols'),
+    'label': (XIBStoryboardParser._is_scene_label, 'scene_labels'),
+}
+
+
 class PlistParser:
     """Plist 파일에서 식별자 추출 (🔥 키 목록 대폭 강화)"""
 
@@ -321,35 +345,43 @@ class PlistParser:
     @classmethod
     def parse(cls, file_path: Path) -> Dict[str, Set[str]]:
         result = defaultdict(set)
+        cls.parse_into(file_path, result)
+        return result
+
+    @classmethod
+    def parse_into(cls, file_path: Path, result: Dict[str, Set[str]]):
+        """파싱 결과를 result(카테고리 → 식별자 집합)에 바로 기록"""
         try:
             # [수정] xml.etree.ElementTree 대신 plistlib을 사용하여 바이너리 Plist도 지원
             with open(file_path, 'rb') as f:
                 plist_data = plistlib.load(f)
-            cls._recursive_parse(plist_data, result)
+            cls._walk(plist_data, result)
         except Exception:
             pass
-        return dict(result)
 
     @classmethod
-    def _recursive_parse(cls, data: any, result: defaultdict):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in cls.PRINCIPAL_CLASS_KEYS and isinstance(value, str):
-                    if cls._is_valid_class_name(value):
-                        result['principal_classes'].add(value)
-                elif key in cls.STRING_IDENTIFIER_KEYS and isinstance(value, str):
-                    if cls._is_valid_bundle_id_style(value):
-                        result['bundle_identifiers'].add(value)
-                # [추가] NSUserActivityTypes 키 처리
-                elif key == "NSUserActivityTypes" and isinstance(value, list):
-                    for activity_type in value:
-                        if isinstance(activity_type, str) and cls._is_valid_bundle_id_style(activity_type):
-                            result['user_activity_types'].add(activity_type)
-                else:
-                    cls._recursive_parse(value, result)
-        elif isinstance(data, list):
-            for item in data:
-                cls._recursive_parse(item, result)
+    def _walk(cls, data: any, result: defaultdict):
+        # 깊게 중첩된 plist 에서도 함수 호출 오버헤드가 없도록 재귀 대신 명시적 스택으로 순회
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key in cls.PRINCIPAL_CLASS_KEYS and isinstance(value, str):
+                        if cls._is_valid_class_name(value):
+                            result['principal_classes'].add(value)
+                    elif key in cls.STRING_IDENTIFIER_KEYS and isinstance(value, str):
+                        if cls._is_valid_bundle_id_style(value):
+                            result['bundle_identifiers'].add(value)
+                    # [추가] NSUserActivityTypes 키 처리
+                    elif key == "NSUserActivityTypes" and isinstance(value, list):
+                        for activity_type in value:
+                            if isinstance(activity_type, str) and cls._is_valid_bundle_id_style(activity_type):
+                                result['user_activity_types'].add(activity_type)
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(node)
 
     @staticmethod
     def _is_valid_class_name(name: str) -> bool:
@@ -366,6 +398,12 @@ class CoreDataParser:
     @classmethod
     def parse(cls, model_path: Path) -> Dict[str, Set[str]]:
         result = defaultdict(set)
+        cls.parse_into(model_path, result)
+        return result
+
+    @classmethod
+    def parse_into(cls, model_path: Path, result: Dict[str, Set[str]]):
+        """파싱 결과를 result(카테고리 → 식별자 집합)에 바로 기록"""
 
         if model_path.is_dir():
             for xcdatamodel in model_path.glob('*.xcdatamodel'):
@@ -375,36 +413,44 @@ class CoreDataParser:
         else:
             cls._parse_contents(model_path, result)
 
-        return dict(result)
-
     @classmethod
     def _parse_contents(cls, contents_file: Path, result: defaultdict):
+        parsed = defaultdict(set)
+
         try:
-            tree = ET.parse(contents_file)
-            root = tree.getroot()
+            # entity/fetchRequest 가 닫힐 때마다 처리하는 스트리밍 순회
+            for _, elem in ET.iterparse(str(contents_file), events=('end',)):
+                tag = elem.tag
+
+                if tag == 'entity':
+                    name = elem.get('name')
+                    if name and cls._is_valid_identifier(name):
+                        parsed['entities'].add(name)
+
+                    for attr in elem.findall('attribute'):
+                        attr_name = attr.get('name')
+                        if attr_name and cls._is_valid_identifier(attr_name):
+                            parsed['attributes'].add(attr_name)
 
-            for entity in root.findall('.//entity'):
-                name = entity.get('name')
-                if name and cls._is_valid_identifier(name):
-                    result['entities'].add(name)
+                    for rel in elem.findall('relationship'):
+                        rel_name = rel.get('name')
+                        if rel_name and cls._is_valid_identifier(rel_name):
+                            parsed['relationships'].add(rel_name)
 
-                for attr in entity.findall('attribute'):
-                    attr_name = attr.get('name')
-                    if attr_name and cls._is_valid_identifier(attr_name):
-                        result['attributes'].add(attr_name)
+                    _release_element(elem)
 
-                for rel in entity.findall('relationship'):
-                    rel_name = rel.get('name')
-                    if rel_name and cls._is_valid_identifier(rel_name):
-                        result['relationships'].add(rel_name)
+                elif tag == 'fetchRequest':
+                    name = elem.get('name')
+                    if name and cls._is_valid_identifier(name):
+                        parsed['fetch_requests'].add(name)
 
-            for fetch in root.findall('.//fetchRequest'):
-                name = fetch.get('name')
-                if name and cls._is_valid_identifier(name):
-                    result['fetch_requests'].add(name)
+                    _release_element(elem)
 
         except Exception:
-            pass
+            return
+
+        for category, names in parsed.items():
+            result[category].update(names)
 
     @staticmethod
     def _is_valid_identifier(name: str) -> bool:
@@ -415,11 +461,7 @@ class CoreDataParser:
         if not (name[0].isalpha() or name[0] == '_'):
             return False
 
-        for char in name:
-            if not (char.isalnum() or char == '_'):
-                return False
-
-        return True
+        return _WORD_RE.fullmatch(name) is not None
 
 
 class StringsFileParser:
@@ -430,13 +472,11 @@ class StringsFileParser:
         keys = set()
 
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            data = file_path.read_bytes()
 
             # "key" = "value"; 패턴
-            pattern = re.compile(r'^"([^"]+)"\s*=\s*"[^"]*"\s*;', re.MULTILINE)
-
-            for match in pattern.finditer(content):
-                key = match.group(1)
+            for match in _STRINGS_ENTRY_RE.finditer(data):
+                key = match.group(1).decode('utf-8', errors='ignore')
                 if key and cls._is_valid_localization_key(key):
                     keys.add(key)
 
@@ -451,24 +491,16 @@ class StringsFileParser:
         if not key or len(key) < 2:
             return False
 
-        # 특수문자로 시작하는 키 제외 (%, $, @ 등)
-        # ✅ 숫자로 시작하는 키는 허용하지 않음 (일반적이지 않음)
-        if not (key[0].isalnum() or key[0] in ('_', '-')):
-            return False
-
         # 공백이 있는 경우: 5단어 이상이면 일반 문장으로 간주
         if ' ' in key:
             words = key.split()
             if len(words) > 5:
                 return False
 
+        # 특수문자로 시작하는 키 제외 (%, $, @ 등)
+        # ✅ 숫자로 시작하는 키는 허용하지 않음 (일반적이지 않음)
         # 허용 문자: 영문자, 숫자, 점, 언더스코어, 하이픈, 공백(제한적)
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._- ')
-        for char in key:
-            if char not in allowed_chars:
-                return False
-
-        return True
+        return _LOCALIZATION_KEY_RE.fullmatch(key) is not None
 
 
 class EntitlementsParser:
@@ -477,69 +509,70 @@ class EntitlementsParser:
     @classmethod
     def parse(cls, file_path: Path) -> Dict[str, Set[str]]:
         result = defaultdict(set)
+        cls.parse_into(file_path, result)
+        return result
+
+    @classmethod
+    def parse_into(cls, file_path: Path, result: Dict[str, Set[str]]):
+        """파싱 결과를 result(카테고리 → 식별자 집합)에 바로 기록"""
 
         try:
-            tree = ET.parse(file_path)
+            tree = _parse_xml(file_path)
             root = tree.getroot()
 
             main_dict = root.find('dict')
             if main_dict is None:
-                return dict(result)
-
-            children = list(main_dict)
-            i = 0
-
-            while i < len(children):
-                if children[i].tag == 'key':
-                    key = children[i].text
-                    if i + 1 < len(children):
-                        value_elem = children[i + 1]
-
-                        # App Groups
-                        if key == 'com.apple.security.application-groups' and value_elem.tag == 'array':
-                            for string_elem in value_elem.findall('string'):
-                                text = string_elem.text
-                                if text and cls._is_valid_identifier(text):
-                                    result['app_groups'].add(text)
-
-                        # Keychain Access Groups
-                        elif key == 'keychain-access-groups' and value_elem.tag == 'array':
-                            for string_elem in value_elem.findall('string'):
-                                text = string_elem.text
-                                if text and cls._is_valid_identifier(text):
-                                    result['keychain_groups'].add(text)
-
-                        # iCloud Container Identifiers
-                        elif key == 'com.apple.developer.icloud-container-identifiers' and value_elem.tag == 'array':
-                            for string_elem in value_elem.findall('string'):
-                                text = string_elem.text
-                                if text and cls._is_valid_identifier(text):
-                                    result['icloud_containers'].add(text)
-
-                        # Ubiquity KV Store Identifier
-                        elif key == 'com.apple.developer.ubiquity-kvstore-identifier' and value_elem.tag == 'string':
-                            text = value_elem.text
-                            if text and cls._is_valid_identifier(text):
-                                result['ubiquity_kvstore'].add(text)
-
-                        # Associated Domains
-                        elif key == 'com.apple.developer.associated-domains' and value_elem.tag == 'array':
-                            for string_elem in value_elem.findall('string'):
-                                text = string_elem.text
-                                if text and cls._is_valid_domain(text):
-                                    result['associated_domains'].add(text)
-
-                        i += 2
-                    else:
-                        i += 1
-                else:
-                    i += 1
+                return
+
+            # key/value 쌍을 이터레이터로 순회 (key 가 아닌 요소는 건너뛰어 짝을 맞춤)
+            # 주석/PI 노드는 tag 가 문자열이 아니므로 짝을 맞추기 전에 제외
+            it = (child for child in main_dict if isinstance(child.tag, str))
+
+            for key_elem in it:
+                if key_elem.tag != 'key':
+                    continue
+                value_elem = next(it, None)
+                if value_elem is None:
+                    break
+                key = key_elem.text
+
+                # App Groups
+                if key == 'com.apple.security.application-groups' and value_elem.tag == 'array':
+                    for string_elem in value_elem.findall('string'):
+                        text = string_elem.text
+                        if text and cls._is_valid_identifier(text):
+                            result['app_groups'].add(text)
+
+                # Keychain Access Groups
+                elif key == 'keychain-access-groups' and value_elem.tag == 'array':
+                    for string_elem in value_elem.findall('string'):
+                        text = string_elem.text
+                        if text and cls._is_valid_identifier(text):
+                            result['keychain_groups'].add(text)
+
+                # iCloud Container Identifiers
+                elif key == 'com.apple.developer.icloud-container-identifiers' and value_elem.tag == 'array':
+                    for string_elem in value_elem.findall('string'):
+                        text = string_elem.text
+                        if text and cls._is_valid_identifier(text):
+                            result['icloud_containers'].add(text)
+
+                # Ubiquity KV Store Identifier
+                elif key == 'com.apple.developer.ubiquity-kvstore-identifier' and value_elem.tag == 'string':
+                    text = value_elem.text
+                    if text and cls._is_valid_identifier(text):
+                        result['ubiquity_kvstore'].add(text)
+
+                # Associated Domains
+                elif key == 'com.apple.developer.associated-domains' and value_elem.tag == 'array':
+                    for string_elem in value_elem.findall('string'):
+                        text = string_elem.text
+                        if text and cls._is_valid_domain(text):
+                            result['associated_domains'].add(text)
 
         except Exception:
             pass
 
-        return dict(result)
-
     @staticmethod
     def _is_valid_identifier(identifier: str) -> bool:
         """유효한 identifier인지 검사"""
@@ -550,17 +583,8 @@ class EntitlementsParser:
         if identifier.startswith('$(') and ')' in identifier:
             return True
 
-        # 일반 케이스
-        if not (identifier[0].isalpha() or identifier[0] == '$'):
-            return False
-
-        # 허용 문자
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-$()')
-        for char in identifier:
-            if char not in allowed_chars:
-                return False
-
-        return True
+        # 일반 케이스: 영문자 또는 $ 로 시작, 허용 문자만 사용
+        return _ENTITLEMENT_ID_RE.fullmatch(identifier) is not None
 
     @staticmethod
     def _is_valid_domain(domain: str) -> bool:
@@ -587,126 +611,211 @@ class EntitlementsParser:
             return False
 
         # 허용 문자: 영문자, 숫자, 점, 하이픈
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-')
-        for char in host:
-            if char not in allowed_chars:
-                return False
-
-        return True
+        return _DOMAIN_HOST_RE.fullmatch(host) is not None
+
+
+# 확장자 → (파일 종류(stats 키), 진행 로그 라벨)
+_DIR_SUFFIX_DISPATCH = {
+    '.xcdatamodeld': ('coredata', 'CoreData'),
+    '.xcassets': ('assets', 'Assets'),
+}
+_FILE_SUFFIX_DISPATCH = {
+    '.xib': ('xib', 'XIB'),
+    '.storyboard': ('storyboard', 'Storyboard'),
+    '.plist': ('plist', 'Plist'),
+    '.strings': ('strings', 'Strings'),
+    '.entitlements': ('entitlements', 'Entitlements'),
+}
+
+# 요약 출력 순서
+_SCAN_LABELS = [*_DIR_SUFFIX_DISPATCH.values(), *_FILE_SUFFIX_DISPATCH.values()]
+
+# 파일 종류(stats 키) → 결과 file_type
+_FILE_TYPES = {
+    'coredata': 'CoreData',
+    'assets': 'Assets',
+    'xib': 'XIB/Storyboard',
+    'storyboard': 'XIB/Storyboard',
+    'plist': 'Plist',
+    'strings': 'Strings',
+    'entitlements': 'Entitlements',
+}
+
+
+def _parse_into(kind: str, path: Path, result: Dict[str, Set[str]]):
+    """리소스 파일 하나를 파싱해 result(해당 file_type 의 카테고리 → 식별자 집합)에 바로 기록"""
+    if kind in ('xib', 'storyboard'):
+        XIBStoryboardParser.parse_into(path, result)
+    elif kind == 'plist':
+        PlistParser.parse_into(path, result)
+    elif kind == 'strings':
+        keys = StringsFileParser.parse(path)
+        if keys:
+            result['localization_keys'].update(keys)
+    elif kind == 'entitlements':
+        EntitlementsParser.parse_into(path, result)
+    elif kind == 'coredata':
+        CoreDataParser.parse_into(path, result)
+    elif kind == 'assets':
+        AssetsParser.parse_into(path, result)
+
+
+def _parse_one(kind: str, path: Path) -> Dict[str, Set[str]]:
+    """프로세스 풀 워커용: 파일 하나의 결과를 반환 (pickle 가능하도록 모듈 레벨 함수)"""
+    result = defaultdict(set)
+    _parse_into(kind, path, result)
+    return result
 
 
 class ResourceScanner:
     """프로젝트 전체 리소스 스캔"""
 
-    def __init__(self, project_path: Path, exclude_dirs: List[str] = None):
+    def __init__(self, project_path: Path, exclude_dirs: List[str] = None, verbose: bool = False):
         self.project_path = Path(project_path)
+        # True 면 발견한 파일마다 한 줄씩 출력 (기본은 종류별 개수만 출력)
+        self.verbose = verbose
         self.exclude_dirs = exclude_dirs or [
             '.build', 'build', 'DerivedData', '.git', 'node_modules',
             'Pods', 'Carthage', '.xcodeproj', '.xcworkspace'
         ]
+        self._exclude_set = frozenset(self.exclude_dirs)
         self.results = defaultdict(lambda: defaultdict(set))
         self.stats = defaultdict(int)
+        # 전체 고유 식별자 (스캔/병합 시점에 누적)
+        self._all_identifiers = set()
 
     def should_skip_directory(self, dir_path: Path) -> bool:
-        dir_name = dir_path.name
+        return self._should_skip_name(dir_path.name)
 
+    def _should_skip_name(self, dir_name: str) -> bool:
         if dir_name.startswith('.') and dir_name not in ('.xcodeproj', '.xcworkspace'):
             return True
 
-        if dir_name in self.exclude_dirs:
+        if dir_name in self._exclude_set:
             return True
 
         return False
 
-    def scan_all(self):
+    def scan_all(self, jobs: int = 1):
+        """
+        리소스 파일을 먼저 모두 수집한 뒤 파싱한다.
+        jobs > 1 이면 파일별 파싱을 프로세스 풀에 분산하고, 결과는 수집 순서대로 병합한다.
+        """
         print(f"🔍 프로젝트: {self.project_path}")
         print(f"📂 리소스 파일 검색 중...\n")
 
-        self._scan_directory(self.project_path)
+        files = self._collect_files()
+
+        if not self.verbose:
+            counts = ', '.join(
+                f"{label} {self.stats[kind]}" for kind, label in _SCAN_LABELS if self.stats.get(kind)
+            )
+            print(f"✓ 리소스 파일 {len(files)}개 발견" + (f" ({counts})" if counts else ""))
+
+        if jobs > 1 and len(files) > 1:
+            kinds = [kind for kind, _ in files]
+            paths = [path for _, path in files]
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                for kind, parsed in zip(kinds, executor.map(_parse_one, kinds, paths, chunksize=16)):
+                    self._merge_results(_FILE_TYPES[kind], parsed)
+        else:
+            # 단일 프로세스에서는 파일별 중간 dict 없이 결과 저장소에 바로 기록
+            results = self.results
+            for kind, path in files:
+                _parse_into(kind, path, results[_FILE_TYPES[kind]])
+
+            # 식별자가 하나도 없는 file_type 은 병합 방식과 동일하게 결과에서 제외
+            for file_type in [ft for ft, categories in results.items() if not categories]:
+                del results[file_type]
+
+            for categories in results.values():
+                for identifiers in categories.values():
+                    self._all_identifiers.update(identifiers)
 
         print("\n" + "=" * 60)
         print("📊 추출 결과 요약")
         print("=" * 60)
 
         for file_type, categories in self.results.items():
-            total = sum(len(ids) for ids in categories.values())
-            if total > 0:
+            # 비어 있지 않은 카테고리만 (이름, 개수)로 모아 한 번 정렬
+            counts = sorted((category, len(ids)) for category, ids in categories.items() if ids)
+            if counts:
                 print(f"\n[{file_type}]")
-                for category, identifiers in sorted(categories.items()):
-                    if identifiers:
-                        print(f"  {category:30s}: {len(identifiers):>6}개")
+                for category, count in counts:
+                    print(f"  {category:30s}: {count:>6}개")
 
         print("\n" + "=" * 60)
 
-    def _scan_directory(self, directory: Path):
+    def _collect_files(self) -> List[tuple]:
+        """파싱할 리소스를 (종류, 경로) 목록으로 수집"""
+        # 재귀 대신 os.scandir 이터레이터 스택으로 순회 (순회 순서는 기존 재귀와 동일)
+        # DirEntry.is_dir()/is_file() 은 readdir 의 d_type 을 사용해 추가 stat 호출이 없음
+        files = []
+        stack = []
+        self._push_scandir(stack, self.project_path)
+
         try:
-            for item in directory.iterdir():
-                if item.is_dir():
-                    if not self.should_skip_directory(item):
-                        # CoreData 모델
-                        if item.suffix == '.xcdatamodeld':
-                            print(f"✓ CoreData: {item.name}")
-                            parsed = CoreDataParser.parse(item)
-                            self._merge_results('CoreData', parsed)
-                            self.stats['coredata'] += 1
-
-                        # Assets Catalog
-                        elif item.suffix == '.xcassets':
-                            print(f"✓ Assets: {item.name}")
-                            parsed = AssetsParser.parse(item)
-                            self._merge_results('Assets', parsed)
-                            self.stats['assets'] += 1
-
-                        else:
-                            self._scan_directory(item)
-
-                elif item.is_file():
-                    if item.suffix == '.xib':
-                        print(f"✓ XIB: {item.name}")
-                        parsed = XIBStoryboardParser.parse(item)
-                        self._merge_results('XIB/Storyboard', parsed)
-                        self.stats['xib'] += 1
-
-                    elif item.suffix == '.storyboard':
-                        print(f"✓ Storyboard: {item.name}")
-                        parsed = XIBStoryboardParser.parse(item)
-                        self._merge_results('XIB/Storyboard', parsed)
-                        self.stats['storyboard'] += 1
-
-                    elif item.suffix == '.plist':
-                        if 'xcschememanagement' not in item.name.lower():
-                            print(f"✓ Plist: {item.name}")
-                            parsed = PlistParser.parse(item)
-                            self._merge_results('Plist', parsed)
-                            self.stats['plist'] += 1
-
-                    elif item.suffix == '.strings':
-                        print(f"✓ Strings: {item.name}")
-                        keys = StringsFileParser.parse(item)
-                        if keys:
-                            self.results['Strings']['localization_keys'].update(keys)
-                        self.stats['strings'] += 1
-
-                    elif item.suffix == '.entitlements':
-                        print(f"✓ Entitlements: {item.name}")
-                        parsed = EntitlementsParser.parse(item)
-                        self._merge_results('Entitlements', parsed)
-                        self.stats['entitlements'] += 1
+            while stack:
+                entry = next(stack[-1], None)
+                if entry is None:
+                    stack.pop().close()
+                    continue
+
+                name = entry.name
+                suffix = os.path.splitext(name)[1]
+
+                if entry.is_dir(follow_symlinks=False):
+                    if self._should_skip_name(name):
+                        continue
+
+                    # CoreData 모델 / Assets Catalog 는 디렉토리 단위로 파싱, 나머지는 하위로 내려감
+                    dispatch = _DIR_SUFFIX_DISPATCH.get(suffix)
+                    if dispatch is None:
+                        self._push_scandir(stack, entry.path)
+                        continue
+
+                elif entry.is_file():
+                    dispatch = _FILE_SUFFIX_DISPATCH.get(suffix)
+                    if dispatch is None:
+                        continue
+                    if dispatch[0] == 'plist' and 'xcschememanagement' in name.lower():
+                        continue
+
+                else:
+                    continue
 
+                kind, label = dispatch
+                if self.verbose:
+                    print(f"✓ {label}: {name}")
+                files.append((kind, Path(entry.path)))
+                self.stats[kind] += 1
+        finally:
+            for it in stack:
+                it.close()
+
+        return files
+
+    @staticmethod
+    def _push_scandir(stack: list, directory):
+        try:
+            stack.append(os.scandir(directory))
         except PermissionError:
             pass
 
     def _merge_results(self, file_type: str, parsed: Dict[str, Set[str]]):
+        if not parsed:
+            return
+
+        # file_type 별 저장소와 전체 집합 갱신 메서드를 루프 밖에서 한 번만 조회
+        sink = self.results[file_type]
+        add_all = self._all_identifiers.update
         for category, identifiers in parsed.items():
-            self.results[file_type][category].update(identifiers)
+            sink[category].update(identifiers)
+            add_all(identifiers)
 
     def get_all_identifiers(self) -> Set[str]:
-        """모든 식별자 통합"""
-        all_ids = set()
-        for file_type, categories in self.results.items():
-            for identifiers in categories.values():
-                all_ids.update(identifiers)
-        return all_ids
+        """모든 식별자 통합 (스캔 중 누적된 집합을 그대로 반환하므로 수정하지 말 것)"""
+        return self._all_identifiers
 
     def get_identifiers_with_metadata(self) -> Dict[str, Dict[str, any]]:
         """식별자별 메타데이터 포함하여 반환"""
@@ -755,8 +864,12 @@ class ResourceScanner:
             }
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson 은 항상 UTF-8 로 출력 (ensure_ascii=False 와 동일)
+            output_path.write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
 
         print(f"\n💾 JSON 저장: {output_path}")
 
@@ -765,8 +878,9 @@ class ResourceScanner:
         all_ids = self.get_all_identifiers()
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, 'w', encoding='utf-8') as f:
-            for identifier in sorted(all_ids):
-                f.write(identifier + '\n')
+            # 한 줄에 하나씩, 한 번의 write로 기록
+            if all_ids:
+                f.write('\n'.join(sorted(all_ids)) + '\n')
         print(f"💾 TXT 저장: {output_path} ({len(all_ids)}개)")
 
     def save_categorized_txt(self, output_dir: Path):
@@ -781,8 +895,7 @@ class ResourceScanner:
                     output_file = output_dir / f"{safe_filename}.txt"
 
                     with open(output_file, 'w', encoding='utf-8') as f:
-                        for identifier in sorted(identifiers):
-                            f.write(identifier + '\n')
+                        f.write('\n'.join(sorted(identifiers)) + '\n')
 
                     print(f"💾 {safe_filename}.txt: {len(identifiers)}개")
 
@@ -857,6 +970,8 @@ def main():
     parser.add_argument('--exclude', nargs='+', help='제외할 디렉토리')
     parser.add_argument('--no-metadata', action='store_true', help='JSON에서 메타데이터 제외')
     parser.add_argument('--detailed', action='store_true', help='상세 분석 결과 출력')
+    parser.add_argument('-v', '--verbose', action='store_true', help='발견한 리소스 파일을 하나씩 출력')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='파일 파싱에 사용할 프로세스 수 (기본: 1)')
 
     args = parser.parse_args()
 
@@ -879,8 +994,8 @@ def main():
     print("=" * 60)
     print()
 
-    scanner = ResourceScanner(args.project_path, exclude_dirs)
-    scanner.scan_all()
+    scanner = ResourceScanner(args.project_path, exclude_dirs, verbose=args.verbose)
+    scanner.scan_all(jobs=args.jobs)
 
     # 상세 분석 출력
     if args.detailed:
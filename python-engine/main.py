@@ -21,6 +21,8 @@ def main():
     # [추가] TXT 파일 출력을 위한 새로운 인자
     parser.add_argument("--txt-output", default="../output/final_exclusion_list.txt",
                         help="Path for the output exclusion name list TXT file.")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of worker processes for rule matching (1 = sequential).")
     args = parser.parse_args()
 
     print(f"📂 Loading symbol graph from: {args.symbol_graph_json}")
@@ -39,7 +41,7 @@ def main():
     print(f"  - Loaded {len(rules.rules)} rules.")
 
     engine = AnalysisEngine(graph, rules)
-    engine.run()
+    engine.run(jobs=args.jobs)
 
     results = engine.get_results()
     reporter = ReportGenerator()
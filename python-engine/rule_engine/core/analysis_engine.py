@@ -1,7 +1,21 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 from ..graph.graph_loader import SymbolGraph
 from ..rules.rule_loader import RuleLoader
 from ..rules.pattern_matcher import PatternMatcher
 
+# Per-worker matcher for parallel runs (each worker loads the graph JSON once)
+_worker_matcher = None
+
+
+def _init_worker(graph_path: str):
+    global _worker_matcher
+    _worker_matcher = PatternMatcher(SymbolGraph(graph_path))
+
+
+def _match_rule(index: int, pattern: list):
+    return index, _worker_matcher.match(pattern)
+
 
 class AnalysisEngine:
     """
@@ -15,12 +29,17 @@ class AnalysisEngine:
         self.matcher = PatternMatcher(self.graph)
         self.excluded_symbols = {}
 
-    def run(self):
+    def run(self, jobs: int = 1):
         """
         Iterates through all loaded rules and applies them to the symbol graph.
+
+        With jobs > 1, rule patterns are matched across a process pool; each worker
+        loads the graph once from its JSON file. Results are still recorded in rule order.
         """
         print("🚀 Starting exclusion analysis...")
 
+        parallel_matches = self._match_rules_parallel(jobs) if jobs > 1 else None
+
         # Iterate over each rule loaded from the YAML file
         for i, rule in enumerate(self.rules):
             rule_id = rule.get('id', 'Unknown Rule')
@@ -32,7 +51,10 @@ class AnalysisEngine:
                 continue
 
             # Use the pattern matcher to find all matching symbol IDs
-            matched_ids = self.matcher.match(pattern)
+            if parallel_matches is not None:
+                matched_ids = parallel_matches[i]
+            else:
+                matched_ids = self.matcher.match(pattern)
             print(f"    Found {len(matched_ids)} matching symbols.")
 
             # For each matched symbol, store it with the reason for exclusion
@@ -49,6 +71,21 @@ class AnalysisEngine:
 
         print(f"✅ Analysis complete. Found {len(self.excluded_symbols)} unique symbols to exclude.")
 
+    def _match_rules_parallel(self, jobs: int) -> dict:
+        """Matches every rule pattern in a process pool and returns {rule index: matched ids}."""
+        print(f"  - Matching {len(self.rules)} rules with {jobs} worker processes...")
+        matches = {}
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(self.graph.json_path,)) as executor:
+            futures = [
+                executor.submit(_match_rule, i, rule['pattern'])
+                for i, rule in enumerate(self.rules) if rule.get('pattern')
+            ]
+            for future in as_completed(futures):
+                index, matched_ids = future.result()
+                matches[index] = matched_ids
+        return matches
+
     def get_results(self) -> list:
         """
         Formats the analysis results into a structured list of dictionaries,
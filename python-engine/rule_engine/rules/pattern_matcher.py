@@ -1,17 +1,62 @@
-from typing import Set, Dict, Any, List
+from typing import Set, Dict, Any, List, Callable
 from ..graph.graph_loader import SymbolGraph
 
 
+# 연산자별 비교 함수 (속성값이 None이면 '!='만 참)
+def _op_eq(prop_value: Any, required_value: Any) -> bool:
+    return prop_value is not None and prop_value == required_value
+
+
+def _op_ne(prop_value: Any, required_value: Any) -> bool:
+    return prop_value is None or prop_value != required_value
+
+
+def _op_in(prop_value: Any, required_value: Any) -> bool:
+    return prop_value is not None and isinstance(required_value, list) and prop_value in required_value
+
+
+def _op_contains(prop_value: Any, required_value: Any) -> bool:
+    return isinstance(prop_value, str) and isinstance(required_value, str) and required_value in prop_value
+
+
+def _op_contains_any(prop_value: Any, required_value: Any) -> bool:
+    return isinstance(prop_value, list) and isinstance(required_value, list) \
+        and any(item in prop_value for item in required_value)
+
+
+def _op_starts_with(prop_value: Any, required_value: Any) -> bool:
+    return isinstance(prop_value, str) and prop_value.startswith(required_value)
+
+
+def _op_unknown(prop_value: Any, required_value: Any) -> bool:
+    return False
+
+
+# 컴파일 시 연산자 문자열을 비교 함수로 한 번만 변환 (매칭 중 문자열 비교 없음)
+_OPS = {
+    '==': _op_eq,
+    '!=': _op_ne,
+    'in': _op_in,
+    'contains': _op_contains,
+    'contains_any': _op_contains_any,
+    'starts_with': _op_starts_with,
+}
+
+
 class PatternMatcher:
     """Matches patterns from rules against the symbol graph. (Improved Version)"""
 
     def __init__(self, graph: SymbolGraph):
         self.graph = graph
+        # 경로 키 → 탐색 방향과 엣지 타입 (타입은 불변 튜플로 미리 고정)
         self.path_map = {
-            'parent': {'direction': 'in', 'type': ['CONTAINS']},
-            'child': {'direction': 'out', 'type': ['CONTAINS']},
-            'superclass': {'direction': 'out', 'type': ['INHERITS_FROM', 'CONFORMS_TO']},
+            'parent': {'direction': 'in', 'types': ('CONTAINS',)},
+            'child': {'direction': 'out', 'types': ('CONTAINS',)},
+            'superclass': {'direction': 'out', 'types': ('INHERITS_FROM', 'CONFORMS_TO')},
         }
+        # id(pattern) → (pattern, 인덱스 조회 조건, 나머지 컴파일된 조건 리스트)
+        # 같은 규칙이 여러 번 매칭되어도 조건 문자열 파싱은 한 번만 수행
+        self._compiled: Dict[int, tuple] = {}
 
     def match(self, pattern: List[Dict[str, Any]]) -> Set[str]:
         find_clause = next((item['find'] for item in pattern if 'find' in item), None)
@@ -19,168 +64,223 @@ class PatternMatcher:
         if not find_clause or not find_clause.get('target'):
             return set()
 
-        candidate_ids = set(self.graph.find_all_nodes())
-        for condition in where_clauses:
-            candidate_ids = self._apply_single_condition(candidate_ids, condition)
+        index_probes, conditions = self._get_compiled(pattern, where_clauses)
+
+        # 리터럴 비교 조건은 전체 노드를 훑지 않고 속성 인덱스의 교집합으로 후보를 만듦
+        # 하나라도 일치하는 노드가 없으면 나머지 조건은 볼 필요 없음
+        if index_probes:
+            candidate_ids = None
+            for prop, values in index_probes:
+                hits = self.graph.find_nodes_by_property(prop, values)
+                candidate_ids = hits if candidate_ids is None else candidate_ids & hits
+                if not candidate_ids:
+                    return set()
+        else:
+            candidate_ids = set(self.graph.find_all_nodes())
+        for condition in conditions:
+            candidate_ids = self._apply_compiled(candidate_ids, condition)
             if not candidate_ids:
                 break
         return candidate_ids
 
-    def _apply_single_condition(self, current_ids: Set[str], condition: Any) -> Set[str]:
+    def _get_compiled(self, pattern: List[Dict[str, Any]], where_clauses: List) -> tuple:
+        """
+        패턴의 where 조건을 컴파일해 캐시 (pattern 객체를 함께 보관해 id 재사용 방지)
+
+        Returns:
+            ([(속성, 값 튜플)...] 인덱스 조회 조건, 나머지 컴파일된 조건 리스트)
+        """
+        cached = self._compiled.get(id(pattern))
+        if cached is None or cached[0] is not pattern:
+            # where 조건은 모두 노드별 필터(AND)이므로 인덱스 조회로 대체 가능한 것만 분리해도 결과 동일
+            index_probes, conditions = [], []
+            for condition in where_clauses:
+                compiled = self._compile_condition(condition)
+                probe = self._index_probe(compiled)
+                if probe is not None:
+                    index_probes.append(probe)
+                else:
+                    conditions.append(compiled)
+            cached = (pattern, index_probes, conditions)
+            self._compiled[id(pattern)] = cached
+        return cached[1], cached[2]
+
+    def _index_probe(self, condition: tuple):
+        """'X.<인덱스 속성> == 문자열' / 'X.<인덱스 속성> in [문자열...]' 조건이면 (속성, 값 튜플), 아니면 None"""
+        if condition[0] != 'prop':
+            return None
+        _, traversal, prop, check, value = condition
+        if traversal or prop not in self.graph.INDEXED_PROPERTIES:
+            return None
+        if check is _op_eq and isinstance(value, str):
+            return prop, (value,)
+        if check is _op_in and isinstance(value, list) and all(isinstance(v, str) for v in value):
+            return prop, tuple(value)
+        return None
+
+    def _compile_condition(self, condition: Any) -> tuple:
+        """
+        조건 하나를 태그가 붙은 튜플로 변환
+
+        - ('not_exists', [하위 조건...])
+        - ('edge', direction, edge_type)
+        - ('prop', 경로 키 튜플, target_prop, check, value): 경로를 따라간 노드의 속성 비교
+        - ('parent_prop', target_prop, check, value): parentId로 찾은 부모의 속성 비교
+          (check: _OPS에서 찾은 비교 함수)
+        - ('none',): 항상 빈 집합 (잘못된 속성 조건)
+        - ('pass',): 항상 통과 (알 수 없는 조건)
+        """
         if isinstance(condition, dict) and "not_exists" in condition:
-            invalid_ids = self._match_not_exists(current_ids, condition["not_exists"])
-            return current_ids - invalid_ids
+            # 하위 조건은 노드별 필터라 순서와 무관하므로 싼 조건부터 적용해 빨리 탈락시킴
+            sub_conditions = [self._compile_condition(sub) for sub in condition["not_exists"]]
+            return ('not_exists', sorted(sub_conditions, key=self._condition_cost))
         if isinstance(condition, str):
             if '-->' in condition or '<--' in condition:
-                return self._filter_by_edge(current_ids, condition)
-            else:
-                return self._filter_by_property(current_ids, condition)
-        return current_ids
-
-    def _filter_by_property(self, current_ids: Set[str], condition: str) -> Set[str]:
-        """Filters nodes by property, with support for multi-step path traversal."""
-        matching_ids = set()
-        parts = condition.split()
-        if len(parts) < 3:
-            return matching_ids
-
-        prop_path_str, operator, value_str = parts[0], parts[1], ' '.join(parts[2:])
-        value = self._parse_value(value_str)
-
+                return ('edge',) + self._parse_edge(condition)
+            parts = condition.split()
+            if len(parts) < 3:
+                return ('none',)
+            return self._compile_property(parts[0], parts[1], self._parse_value(' '.join(parts[2:])))
+        return ('pass',)
+
+    def _compile_property(self, prop_path_str: str, operator: str, value: Any) -> tuple:
+        """속성 경로 문자열을 미리 토큰화해 매칭 시 문자열 처리가 없도록 함"""
+        check = _OPS.get(operator, _op_unknown)
         path_components = prop_path_str.split('.')
-        if len(path_components) < 1:
-            return matching_ids
-
         variable_name = path_components[0]
 
         # ✅ 특별 처리: P.parent.typeInheritanceChain 패턴
+        # 예: P.parent.typeInheritanceChain contains_any ['Codable']
         if variable_name in ['P', 'M', 'S', 'E', 'C'] and len(path_components) == 3 and path_components[1] == 'parent':
-            # 예: P.parent.typeInheritanceChain contains_any ['Codable']
-            target_prop = path_components[2]
-
-            for node_id in current_ids:
-                node = self.graph.get_node(node_id)
-                if not node:
-                    continue
-
-                # parentId로 부모 찾기
-                parent_id = node.get('parentId')
-                if not parent_id:
-                    continue
-
-                parent_node = self.graph.get_node(parent_id)
-                if not parent_node:
-                    continue
-
-                prop_value = parent_node.get(target_prop)
-                if self._check_value(prop_value, operator, value):
-                    matching_ids.add(node_id)
-
-            return matching_ids
+            return ('parent_prop', path_components[2], check, value)
 
         # parent를 직접 속성으로 사용하는 경우
+        # 예: parent.name == "SomeClass"
         if variable_name == 'parent' and len(path_components) >= 2:
-            # 예: parent.name == "SomeClass"
-            target_prop = path_components[1]
+            return ('parent_prop', path_components[1], check, value)
+
+        # 기존 로직: 일반 속성 경로 처리 (e.g., 'parent', 'superclass')
+        traversal_path = tuple(path_components[1:-1])
+        if any(path_key not in self.path_map for path_key in traversal_path):
+            return ('none',)
+        return ('prop', traversal_path, path_components[-1], check, value)
+
+    def _condition_cost(self, condition: tuple) -> int:
+        """조건 적용 비용 추정치 (자기 속성 < 엣지 존재 < 경로 탐색 후 속성 < 중첩 not_exists)"""
+        tag = condition[0]
+        if tag == 'prop':
+            return 5 if condition[1] else 1
+        if tag == 'parent_prop':
+            return 5
+        if tag == 'edge':
+            return 2
+        if tag == 'not_exists':
+            return 10
+        return 0
+
+    def _apply_compiled(self, current_ids: Set[str], condition: tuple) -> Set[str]:
+        tag = condition[0]
+        if tag == 'prop':
+            return self._filter_by_property(current_ids, *condition[1:])
+        if tag == 'parent_prop':
+            return self._filter_by_parent_property(current_ids, *condition[1:])
+        if tag == 'edge':
+            return self._filter_by_edge(current_ids, *condition[1:])
+        if tag == 'not_exists':
+            invalid_ids = self._match_not_exists(current_ids, condition[1])
+            return current_ids - invalid_ids
+        if tag == 'none':
+            return set()
+        return current_ids
 
-            for node_id in current_ids:
-                node = self.graph.get_node(node_id)
-                if not node:
-                    continue
+    def _filter_by_parent_property(self, current_ids: Set[str], target_prop: str, check: Callable,
+                                   value: Any) -> Set[str]:
+        """parentId로 찾은 부모 노드의 속성으로 필터링"""
+        matching_ids = set()
+        get_node = self.graph.get_node
 
-                # parentId를 통해 부모 노드 찾기
-                parent_id = node.get('parentId')
-                if not parent_id:
-                    continue
+        for node_id in current_ids:
+            node = get_node(node_id)
+            if not node:
+                continue
 
-                parent_node = self.graph.get_node(parent_id)
-                if not parent_node:
-                    continue
+            # parentId로 부모 찾기
+            parent_id = node.get('parentId')
+            if not parent_id:
+                continue
 
-                prop_value = parent_node.get(target_prop)
-                if self._check_value(prop_value, operator, value):
-                    matching_ids.add(node_id)
+            parent_node = get_node(parent_id)
+            if not parent_node:
+                continue
 
-            return matching_ids
+            prop_value = parent_node.get(target_prop)
+            if check(prop_value, value):
+                matching_ids.add(node_id)
 
-        # 기존 로직: 일반 속성 경로 처리
-        traversal_path = path_components[1:-1] if len(path_components) > 1 else []
-        target_prop = path_components[-1] if len(path_components) > 0 else None
+        return matching_ids
+
+    def _filter_by_property(self, current_ids: Set[str], traversal_path: tuple, target_prop: str, check: Callable,
+                            value: Any) -> Set[str]:
+        """Filters nodes by property, with support for multi-step path traversal."""
+        matching_ids = set()
+        # 반복문 안의 속성 조회를 줄이기 위해 지역 변수로 바인딩
+        get_node = self.graph.get_node
+        get_neighbors_bulk = self.graph.get_neighbors_bulk
 
         for node_id in current_ids:
             nodes_to_check_ids = {node_id}
 
-            # Traverse the path (e.g., 'parent', 'superclass')
+            # Traverse the path (e.g., 'parent', 'superclass'), keys validated at compile time
             for path_key in traversal_path:
-                if path_key not in self.path_map:
-                    nodes_to_check_ids = set()
-                    break
-
-                next_nodes_ids = set()
                 path_info = self.path_map[path_key]
-                edge_types = path_info['type']
+                edge_types = path_info['types']
+                direction = path_info['direction']
 
-                # For 'superclass', traverse the entire inheritance chain (BFS)
+                # For 'superclass', take the entire inheritance chain (memoized closure, includes the nodes themselves)
                 if path_key == 'superclass':
-                    q = list(nodes_to_check_ids)
-                    visited_ids = set(q)
-                    while q:
-                        current_id = q.pop(0)
-                        for etype in edge_types:
-                            neighbors = self.graph.get_neighbors(current_id, edge_type=etype,
-                                                                 direction=path_info['direction'])
-                            for nid in neighbors:
-                                if nid not in visited_ids:
-                                    visited_ids.add(nid)
-                                    q.append(nid)
-                    next_nodes_ids = visited_ids
-                else:  # For 'parent' or 'child', traverse only one step
-                    for current_id in nodes_to_check_ids:
-                        for etype in edge_types:
-                            neighbors = self.graph.get_neighbors(current_id, edge_type=etype,
-                                                                 direction=path_info['direction'])
-                            next_nodes_ids.update(neighbors)
+                    ancestors = self.graph.ancestor_closure(edge_types)
+                    next_nodes_ids = set().union(*(ancestors[nid] for nid in nodes_to_check_ids))
+                else:  # For 'parent' or 'child', traverse only one step (precomputed adjacency)
+                    next_nodes_ids = get_neighbors_bulk(nodes_to_check_ids, edge_types, direction)
 
                 nodes_to_check_ids = next_nodes_ids
 
             # Check the property on all nodes reached at the end of the path
             for final_id in nodes_to_check_ids:
-                final_node = self.graph.get_node(final_id)
+                final_node = get_node(final_id)
                 if not final_node:
                     continue
 
                 prop_value = final_node.get(target_prop)
-                if self._check_value(prop_value, operator, value):
+                if check(prop_value, value):
                     matching_ids.add(node_id)
                     break
         return matching_ids
 
-    def _filter_by_edge(self, current_ids: Set[str], condition: str) -> Set[str]:
-        matching_ids = set()
+    def _parse_edge(self, condition: str) -> tuple:
+        """'A --TYPE--> B' / 'A <--TYPE-- B' 형태의 조건에서 (direction, edge_type) 추출"""
         direction, edge_type = 'out', None
         if '-->' in condition:
             parts = condition.split('-->')
-        elif '<--' in condition:
-            direction, parts = 'in', condition.split('<--')
         else:
-            return matching_ids
+            direction, parts = 'in', condition.split('<--')
 
         left, right = parts[0].strip(), parts[1].strip()
         if '--' in left: edge_type = left.rsplit('--', 1)[1].strip()
         if '--' in right and not edge_type: edge_type = right.split('--', 1)[0].strip()
+        return direction, edge_type
 
-        for node_id in current_ids:
-            if self.graph.get_neighbors(node_id, edge_type=edge_type, direction=direction):
-                matching_ids.add(node_id)
-        return matching_ids
+    def _filter_by_edge(self, current_ids: Set[str], direction: str, edge_type: str) -> Set[str]:
+        # 노드별 이웃 조회 대신 로드 시 만든 엣지 보유 노드 집합과 한 번에 교집합
+        return current_ids & self.graph.find_nodes_with_edge(edge_type, direction)
 
-    def _match_not_exists(self, candidate_ids: Set[str], sub_conditions: List) -> Set[str]:
+    def _match_not_exists(self, candidate_ids: Set[str], sub_conditions: List[tuple]) -> Set[str]:
         invalid_ids = set()
         for node_id in candidate_ids:
             temp_ids = {node_id}
             all_match = True
             for sub_cond in sub_conditions:
-                temp_ids = self._apply_single_condition(temp_ids, sub_cond)
+                temp_ids = self._apply_compiled(temp_ids, sub_cond)
                 if not temp_ids:
                     all_match = False
                     break
@@ -204,17 +304,3 @@ class PatternMatcher:
                 return float(value_str)
             except ValueError:
                 return value_str
-
-    def _check_value(self, prop_value: Any, operator: str, required_value: Any) -> bool:
-        if prop_value is None: return operator == '!='
-        if operator == '==': return prop_value == required_value
-        if operator == '!=': return prop_value != required_value
-        if operator == 'in': return isinstance(required_value, list) and prop_value in required_value
-        if operator == 'contains':
-            return isinstance(prop_value, str) and isinstance(required_value, str) and required_value in prop_value
-        if operator == 'contains_any':
-            if isinstance(prop_value, list) and isinstance(required_value, list):
-                return any(item in prop_value for item in required_value)
-        if operator == 'starts_with':
-            return isinstance(prop_value, str) and prop_value.startswith(required_value)
-        return False
@@ -0,0 +1,12 @@
+# tests/conftest.py
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 각 하위 프로젝트는 자신의 디렉터리를 기준으로 임포트하므로 경로를 직접 추가
+for sub_dir in ("obfuscation-analyzer", "learning"):
+    path = str(ROOT / sub_dir)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,19 @@
+# tests/test_github_crawler.py
+
+import pytest
+
+from github_crawler import GitHubCrawler
+
+
+@pytest.mark.parametrize("languages, threshold, expected", [
+    ({"Swift": 80, "Objective-C": 20}, 0.8, True),     # 경계값은 통과
+    ({"Swift": 79, "Objective-C": 21}, 0.8, False),
+    ({"Swift": 875, "C": 125}, 0.875, True),           # 퍼센트 단위로 반올림하지 않음
+    ({"Swift": 874, "C": 126}, 0.875, False),
+    ({"Swift": 804, "C": 196}, 0.805, False),
+    ({"Objective-C": 100}, 0.8, False),
+    ({}, 0.8, False),
+    ({}, 0.0, True),
+])
+def test_swift_ratio_at_least_uses_exact_threshold(languages, threshold, expected):
+    assert GitHubCrawler().swift_ratio_at_least(languages, threshold) is expected
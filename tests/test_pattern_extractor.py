@@ -0,0 +1,136 @@
+# tests/test_pattern_extractor.py
+
+import pattern_extractor
+
+
+SWIFT_SOURCE = """import UIKit
+
+class Foo {
+    class var shared: Foo { Foo() }
+    class func make() -> Foo { Foo() }
+    var title: String = ""
+    let _hidden: Int = 0
+    func tableViewDidSelectRow(_ x: Int) {}
+    func willAppear () {}
+    func didTap(_ s: Any) {}
+}
+struct Bar {}
+enum Baz {}
+protocol Qux {}
+"""
+
+
+def _extract(source: str, dependencies=None):
+    patterns = pattern_extractor._new_pattern_counters()
+    pattern_extractor._extract_patterns_from_file(source.encode(), dependencies, patterns)
+    return patterns
+
+
+def test_fused_scan_counts():
+    """한 번의 스캔으로 프로퍼티/메서드/타입/프로토콜/델리게이트를 추출"""
+    patterns = _extract(SWIFT_SOURCE)
+
+    assert patterns["property_names"] == {"shared": 1, "title": 1}
+    assert patterns["method_names"] == {"make": 1, "tableViewDidSelectRow": 1, "willAppear": 1, "didTap": 1}
+    assert patterns["protocol_names"] == {"Qux": 1}
+    # 델리게이트 패턴마다 1회씩 (tableView* 와 *DidSelect* 에 모두 해당), 이름 뒤 공백이 있으면 제외
+    assert patterns["delegate_methods"] == {"tableViewDidSelectRow": 2, "didTap": 1}
+
+
+def test_class_var_and_class_func_are_not_type_names():
+    """'class var' / 'class func' 의 var/func 는 타입 이름으로 세지 않음 (이전에는 클래스 이름으로 집계됨)"""
+    patterns = _extract(SWIFT_SOURCE)
+
+    assert patterns["class_names"] == {"Foo": 1, "Bar": 1, "Baz": 1}
+
+
+FRAMEWORK_SOURCE = """import RxSwift
+import Alamofire
+button.rx.tap.bind(to: viewModel.tap).disposed(by: disposeBag)
+Observable.just(1).subscribe(onNext: { _ in }).disposed(by: disposeBag)
+AF.request(url).validate().response(completionHandler: handle)
+"""
+
+FRAMEWORK_COUNTS = {("RxSwift", "rx_binding"): 5, ("Alamofire", "networking"): 3}
+
+
+def test_framework_literal_counts():
+    """의존성별 리터럴 등장 횟수를 (프레임워크, 카테고리)로 집계 (이전에는 Counter += int 로 TypeError)"""
+    patterns = _extract(FRAMEWORK_SOURCE, ["RxSwift", "Alamofire", "Kingfisher"])
+
+    assert patterns["framework_patterns"] == FRAMEWORK_COUNTS
+
+
+def test_framework_literals_only_for_mentioned_dependencies():
+    """파일에 이름이 나오지 않는 의존성의 리터럴은 세지 않음"""
+    source = FRAMEWORK_SOURCE.replace("import RxSwift\n", "")
+
+    patterns = _extract(source, ["RxSwift", "Alamofire"])
+
+    assert patterns["framework_patterns"] == {("Alamofire", "networking"): 3}
+
+
+def test_framework_literal_fallback_without_automaton(monkeypatch):
+    """pyahocorasick 이 없을 때의 find 기반 집계도 결과 동일"""
+    monkeypatch.setattr(pattern_extractor, "_FRAMEWORK_AC", None)
+
+    patterns = _extract(FRAMEWORK_SOURCE, ["RxSwift", "Alamofire"])
+
+    assert patterns["framework_patterns"] == FRAMEWORK_COUNTS
+
+
+def test_framework_literals_across_scan_windows(tmp_path, monkeypatch):
+    """mmap 으로 읽는 큰 파일을 작은 구간으로 나눠 스캔해도 경계에 걸친 리터럴을 한 번씩만 셈"""
+    monkeypatch.setattr(pattern_extractor, "_AC_CHUNK_SIZE", 7)
+    swift_file = tmp_path / "Large.swift"
+    swift_file.write_text(FRAMEWORK_SOURCE * 200, encoding="utf-8")
+
+    patterns = pattern_extractor._scan_files([swift_file], ["RxSwift", "Alamofire"])
+
+    assert patterns["framework_patterns"] == {key: count * 200 for key, count in FRAMEWORK_COUNTS.items()}
+
+
+def test_frequent_framework_patterns(tmp_path):
+    """프레임워크 패턴은 프레임워크별 [{pattern, count}] 목록으로 보고"""
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "Feed.swift").write_text(FRAMEWORK_SOURCE, encoding="utf-8")
+
+    extractor = pattern_extractor.PatternExtractor()
+    extractor.analyze_all_projects([
+        {"local_path": str(tmp_path / name), "dependencies": ["RxSwift", "Alamofire"]}
+        for name in ("a", "b")
+    ])
+
+    frequent = extractor.get_frequent_patterns(min_frequency=0.5, min_occurrences=1)
+    assert frequent["framework_patterns"] == {
+        "Alamofire": [{"pattern": "networking", "count": 6}],
+        "RxSwift": [{"pattern": "rx_binding", "count": 10}],
+    }
+
+
+ARCHITECTURE_SOURCE = """final class HomeViewController {}
+class HomeViewControllerHelper {}
+class ProfileView {}
+class DataManager {}
+class ItemCell {}
+class AppCoordinatorFactory {}
+"""
+
+
+def test_architecture_patterns_count_suffixes():
+    """
+    아키텍처 역할은 접미사로만 판정 (이전에는 ViewController/ViewModel/Coordinator 를 부분 문자열로 판정했고
+    View/Manager/Service 는 세지 않았음)
+    """
+    patterns = _extract(ARCHITECTURE_SOURCE)
+
+    assert patterns["architecture_patterns"] == {"ViewController": 1, "View": 1, "Manager": 1, "Cell": 1}
+
+
+def test_class_suffix_prefers_longest_suffix():
+    assert pattern_extractor._class_suffix("HomeViewController") == "ViewController"
+    assert pattern_extractor._class_suffix("HomeViewModel") == "ViewModel"
+    assert pattern_extractor._class_suffix("ProfileView") == "View"
+    assert pattern_extractor._class_suffix("AuthService") == "Service"
+    assert pattern_extractor._class_suffix("ViewControllerFactory") is None
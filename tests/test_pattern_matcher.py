@@ -0,0 +1,189 @@
+# tests/test_pattern_matcher.py
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 두 엔진 사본(python-engine / obfuscation-analyzer)은 같은 결과를 내야 함
+sys.path.insert(0, str(ROOT / "python-engine"))
+
+from rule_engine.graph.graph_loader import SymbolGraph as EngineSymbolGraph
+from rule_engine.rules.pattern_matcher import PatternMatcher as EnginePatternMatcher
+from rule_engine.rules.rule_loader import RuleLoader
+from rule_engine.core.analysis_engine import AnalysisEngine
+from lib.analyzer.graph_loader import SymbolGraph as AnalyzerSymbolGraph
+from lib.analyzer.pattern_matcher import PatternMatcher as AnalyzerPatternMatcher
+
+ENGINES = [
+    pytest.param((EngineSymbolGraph, EnginePatternMatcher), id="python-engine"),
+    pytest.param((AnalyzerSymbolGraph, AnalyzerPatternMatcher), id="obfuscation-analyzer"),
+]
+
+
+SYMBOL_GRAPH = {
+    "symbols": [
+        {"id": "app", "name": "AppDelegate", "kind": "class",
+         "typeInheritanceChain": ["UIResponder", "UIApplicationDelegate"], "attributes": ["@main"]},
+        {"id": "home", "name": "HomeViewController", "kind": "class",
+         "typeInheritanceChain": ["UIViewController"], "attributes": []},
+        {"id": "home.viewDidLoad", "name": "viewDidLoad", "kind": "method", "parentId": "home",
+         "attributes": ["override"]},
+        {"id": "home.tapped", "name": "tapped", "kind": "method", "parentId": "home",
+         "attributes": ["@objc", "@IBAction"]},
+        {"id": "user", "name": "User", "kind": "struct", "typeInheritanceChain": ["Codable"]},
+        {"id": "user.name", "name": "name", "kind": "variable", "parentId": "user"},
+        {"id": "user.id", "name": "id", "kind": "variable", "parentId": "user"},
+        {"id": "base", "name": "BaseService", "kind": "class"},
+        {"id": "network", "name": "NetworkService", "kind": "class"},
+        {"id": "network.fetch", "name": "fetch", "kind": "method", "parentId": "network",
+         "attributes": ["@objc"]},
+        {"id": "mock", "name": "MockNetworkService", "kind": "class"},
+        {"id": "fetching", "name": "Fetching", "kind": "protocol"},
+        {"id": "route", "name": "Route", "kind": "enum"},
+        {"id": "route.home", "name": "home", "kind": "case", "parentId": "route"},
+        {"id": "logo", "name": "logoImage", "kind": "variable", "isReferencedByExternalFile": True},
+        {"id": "sys", "name": "description", "kind": "variable", "isSystemSymbol": True},
+    ],
+    "edges": [
+        {"from": "home", "to": "home.viewDidLoad", "type": "CONTAINS"},
+        {"from": "home", "to": "home.tapped", "type": "CONTAINS"},
+        {"from": "user", "to": "user.name", "type": "CONTAINS"},
+        {"from": "user", "to": "user.id", "type": "CONTAINS"},
+        {"from": "network", "to": "network.fetch", "type": "CONTAINS"},
+        {"from": "route", "to": "route.home", "type": "CONTAINS"},
+        {"from": "network", "to": "base", "type": "INHERITS_FROM"},
+        {"from": "mock", "to": "network", "type": "INHERITS_FROM"},
+        {"from": "mock", "to": "fetching", "type": "CONFORMS_TO"},
+        # 심볼 목록에 없는 외부 타입 (속성 없이 엣지로만 생기는 노드)
+        {"from": "home", "to": "UIViewController", "type": "INHERITS_FROM"},
+        {"from": "user", "to": "Codable", "type": "CONFORMS_TO"},
+        {"from": "home.tapped", "to": "network.fetch", "type": "CALLS"},
+    ],
+}
+
+
+def _rule(rule_id, *where):
+    return {"id": rule_id, "pattern": [{"find": {"target": "S"}}, {"where": list(where)}]}
+
+
+# 인덱스/경로/엣지/not_exists 경로를 모두 거치는 규칙 (실제 규칙 파일에는 없는 형태 포함)
+EXTRA_RULES = [
+    _rule("KIND_EQ", "S.kind == 'class'"),
+    _rule("KIND_AND_NAME", "S.kind == 'class'", "S.name in ['AppDelegate', 'BaseService', 'User']"),
+    _rule("NAME_IN_MIXED", "S.name in ['User', 1]"),
+    _rule("KIND_NE", "S.kind != 'method'"),
+    _rule("NAME_CONTAINS", "S.name contains 'Service'"),
+    _rule("NAME_STARTS_WITH", "S.name starts_with 'Home'"),
+    _rule("NAME_MATCHES", "S.name matches '^Home.*'"),
+    _rule("ATTR_CONTAINS_ANY", "S.attributes contains_any ['@objc', '@main']"),
+    _rule("EXTERNAL_REF", "S.isReferencedByExternalFile == true"),
+    _rule("PARENT_ID_NAME", "S.kind == 'method'", "S.parent.name == 'HomeViewController'"),
+    _rule("PARENT_ID_CHAIN", "S.parent.typeInheritanceChain contains_any ['Codable']"),
+    _rule("PARENT_VARIABLE", "parent.name == 'Route'"),
+    _rule("SUPERCLASS_NAME", "S.superclass.name == 'BaseService'"),
+    _rule("SUPERCLASS_KIND", "S.kind == 'class'", "S.superclass.kind == 'protocol'"),
+    _rule("CHILD_NAME", "S.child.name == 'viewDidLoad'"),
+    _rule("CHILD_PARENT_NAME", "S.child.parent.name in ['User', 'Route']"),
+    _rule("UNKNOWN_PATH", "S.sibling.name == 'User'"),
+    _rule("EDGE_OUT_TYPED", "S --INHERITS_FROM--> B"),
+    _rule("EDGE_IN_TYPED", "S <--CONTAINS-- P"),
+    _rule("EDGE_OUT_ANY", "S --> X"),
+    _rule("NOT_EXISTS_SUPER", "S.kind == 'class'", {"not_exists": ["S --INHERITS_FROM--> B"]}),
+    _rule("NOT_EXISTS_MULTI", "S.kind in ['class', 'struct']",
+          {"not_exists": ["S --CONTAINS--> C", "S.name contains 'Service'"]}),
+    {"id": "NO_TARGET", "pattern": [{"find": {}}, {"where": ["S.kind == 'class'"]}]},
+]
+
+# 위 그래프에서의 기대 결과 (리팩터링 전 매처 기준)
+EXPECTED_EXTRA = {
+    "KIND_EQ": {"app", "base", "home", "mock", "network"},
+    "KIND_AND_NAME": {"app", "base"},
+    "NAME_IN_MIXED": {"user"},
+    # 속성 없는 외부 타입 노드(UIViewController, Codable)는 '!=' 조건에도 매칭되지 않음
+    "KIND_NE": {"app", "base", "fetching", "home", "logo", "mock", "network", "route", "route.home",
+                "sys", "user", "user.id", "user.name"},
+    "NAME_CONTAINS": {"base", "mock", "network"},
+    "NAME_STARTS_WITH": {"home"},
+    "NAME_MATCHES": set(),
+    "ATTR_CONTAINS_ANY": {"app", "home.tapped", "network.fetch"},
+    "EXTERNAL_REF": {"logo"},
+    "PARENT_ID_NAME": {"home.tapped", "home.viewDidLoad"},
+    "PARENT_ID_CHAIN": {"user.id", "user.name"},
+    "PARENT_VARIABLE": {"route.home"},
+    "SUPERCLASS_NAME": {"base", "mock", "network"},
+    "SUPERCLASS_KIND": {"mock"},
+    "CHILD_NAME": {"home"},
+    "CHILD_PARENT_NAME": {"route", "user"},
+    "UNKNOWN_PATH": set(),
+    "EDGE_OUT_TYPED": {"home", "mock", "network"},
+    "EDGE_IN_TYPED": {"home.tapped", "home.viewDidLoad", "network.fetch", "route.home",
+                      "user.id", "user.name"},
+    "EDGE_OUT_ANY": {"home", "home.tapped", "mock", "network", "route", "user"},
+    "NOT_EXISTS_SUPER": {"app", "base"},
+    "NOT_EXISTS_MULTI": {"app", "base", "home", "mock", "user"},
+    "NO_TARGET": set(),
+}
+
+# 실제 규칙 파일을 위 그래프에 적용한 결과 중 비어 있지 않은 것 (리팩터링 전 매처 기준)
+EXPECTED_RULE_FILE = {
+    "EXTERNAL_FILE_REFERENCE": {"logo"},
+    "OS_ENTRY_POINT_DELEGATES": {"app"},
+    "OBJC_ATTRIBUTE": {"home.tapped", "network.fetch"},
+    "UI_FRAMEWORK_SUBCLASSES": {"app", "home"},
+    "SYSTEM_TYPE_NAMES": {"sys"},
+    "COMMON_METHOD_NAMES_CRUD": {"network.fetch"},
+    "SWIFTUI_VIEW_SUFFIX": {"home"},
+}
+
+
+@pytest.fixture
+def graph_path(tmp_path):
+    path = tmp_path / "symbol_graph.json"
+    path.write_text(json.dumps(SYMBOL_GRAPH), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="module")
+def file_rules():
+    return RuleLoader(str(ROOT / "rules" / "swift_exclusion_rules.yaml")).rules
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_extra_rules_match_baseline(engine, graph_path):
+    symbol_graph_cls, matcher_cls = engine
+    matcher = matcher_cls(symbol_graph_cls(str(graph_path)))
+
+    for rule in EXTRA_RULES:
+        assert matcher.match(rule["pattern"]) == EXPECTED_EXTRA[rule["id"]], rule["id"]
+
+    # 컴파일 캐시를 거친 두 번째 매칭도 결과 동일
+    for rule in EXTRA_RULES:
+        assert matcher.match(rule["pattern"]) == EXPECTED_EXTRA[rule["id"]], rule["id"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_rule_file_matches_baseline(engine, graph_path, file_rules):
+    symbol_graph_cls, matcher_cls = engine
+    matcher = matcher_cls(symbol_graph_cls(str(graph_path)))
+
+    matches = {rule["id"]: matcher.match(rule["pattern"]) for rule in file_rules}
+
+    assert {rule_id: ids for rule_id, ids in matches.items() if ids} == EXPECTED_RULE_FILE
+
+
+def test_parallel_run_matches_sequential(graph_path, file_rules, tmp_path):
+    """--jobs > 1 의 프로세스 풀 매칭도 순차 실행과 같은 제외 사유를 기록"""
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(json.dumps({"rules": file_rules + EXTRA_RULES[:-1]}), encoding="utf-8")
+    rules = RuleLoader(str(rules_path))
+
+    sequential = AnalysisEngine(EngineSymbolGraph(str(graph_path)), rules)
+    sequential.run()
+    parallel = AnalysisEngine(EngineSymbolGraph(str(graph_path)), rules)
+    parallel.run(jobs=2)
+
+    assert parallel.excluded_symbols == sequential.excluded_symbols
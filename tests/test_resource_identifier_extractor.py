@@ -0,0 +1,246 @@
+# tests/test_resource_identifier_extractor.py
+
+import json
+import plistlib
+from pathlib import Path
+
+from lib.extractors.resource_identifier_extractor import EntitlementsParser, ResourceScanner
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+ENTITLEMENTS_WITH_COMMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+	<key>com.apple.security.application-groups</key>
+	<!-- 위젯 익스텐션과 공유 -->
+	<array>
+		<string>group.com.example.app</string>
+	</array>
+	<?xcode marker?>
+	<key>keychain-access-groups</key>
+	<array>
+		<string>com.example.shared</string>
+	</array>
+</dict>
+</plist>
+"""
+
+
+def test_entitlements_comment_between_key_and_value(tmp_path):
+    """<key> 와 값 사이의 주석/PI 는 값으로 취급하지 않음"""
+    path = tmp_path / "App.entitlements"
+    path.write_text(ENTITLEMENTS_WITH_COMMENT, encoding="utf-8")
+
+    result = EntitlementsParser.parse(path)
+
+    assert result["app_groups"] == {"group.com.example.app"}
+    assert result["keychain_groups"] == {"com.example.shared"}
+
+
+def test_resource_extractor_copies_are_identical():
+    """python-engine 사본은 obfuscation-analyzer 원본과 동일해야 함"""
+    original = ROOT / "obfuscation-analyzer/lib/extractors/resource_identifier_extractor.py"
+    copy = ROOT / "python-engine/external_extractors/resource_identifier_extractor.py"
+
+    assert original.read_bytes() == copy.read_bytes()
+
+
+STORYBOARD = """<?xml version="1.0" encoding="UTF-8"?>
+<document type="com.apple.InterfaceBuilder3.CocoaTouch.Storyboard.XIB" version="3.0">
+    <!-- 메인 화면 -->
+    <scenes>
+        <scene sceneID="a1">
+            <objects>
+                <viewController storyboardIdentifier="HomeScene" customClass="HomeViewController"
+                                customModule="SampleApp" restorationIdentifier="HomeRestore" label="Home">
+                    <view key="view">
+                        <tableView>
+                            <prototypes>
+                                <tableViewCell reuseIdentifier="ItemCell" customClass="ItemCell">
+                                    <imageView image="placeholder-photo"/>
+                                </tableViewCell>
+                            </prototypes>
+                        </tableView>
+                        <button image="icon_close">
+                            <image name="icon_close" systemName="xmark"/>
+                        </button>
+                    </view>
+                    <connections>
+                        <outlet property="tableView" destination="t1" id="o1"/>
+                        <connection kind="outlet" property="closeButton"/>
+                        <connection kind="action" selector="closeTapped:"/>
+                        <connection kind="action" selector="bad selector"/>
+                        <segue identifier="showDetail" destination="b1" kind="show"/>
+                    </connections>
+                    <userDefinedRuntimeAttributes>
+                        <userDefinedRuntimeAttribute keyPath="layer.cornerRadius"/>
+                    </userDefinedRuntimeAttributes>
+                </viewController>
+                <viewController customClass="UIViewController" label="a"/>
+            </objects>
+        </scene>
+    </scenes>
+</document>
+"""
+
+XIB = """<?xml version="1.0" encoding="UTF-8"?>
+<document type="com.apple.InterfaceBuilder3.CocoaTouch.XIB" version="3.0">
+    <objects>
+        <view customClass="ProfileHeaderView">
+            <connections>
+                <outlet property="avatarView" destination="x1" id="o2"/>
+            </connections>
+        </view>
+    </objects>
+</document>
+"""
+
+COREDATA_CONTENTS = """<?xml version="1.0" encoding="UTF-8"?>
+<model>
+    <entity name="Person" representedClassName="PersonMO">
+        <attribute name="fullName" attributeType="String"/>
+        <attribute name="id" attributeType="UUID"/>
+        <relationship name="friends" destinationEntity="Person"/>
+    </entity>
+    <fetchRequest name="AllPeople" entity="Person"/>
+</model>
+"""
+
+ENTITLEMENTS = """<?xml version="1.0" encoding="UTF-8"?>
+<plist version="1.0">
+<dict>
+    <key>com.apple.security.application-groups</key>
+    <array><string>group.com.example.app</string><string>$(TeamID).shared</string></array>
+    <key>keychain-access-groups</key>
+    <array><string>$(AppIdentifierPrefix)com.example.app</string></array>
+    <key>stray</key>
+    <key>com.apple.developer.icloud-container-identifiers</key>
+    <array><string>iCloud.com.example.app</string></array>
+    <key>com.apple.developer.ubiquity-kvstore-identifier</key>
+    <string>$(TeamIdentifierPrefix)kvstore</string>
+    <key>com.apple.developer.associated-domains</key>
+    <array><string>applinks:example.com</string><string>bad</string></array>
+</dict>
+</plist>
+"""
+
+INFO_PLIST = {
+    "CFBundleIdentifier": "com.example.app",
+    "NSPrincipalClass": "SampleApplication",
+    "NSUserActivityTypes": ["com.example.app.browse", "x"],
+    "UIApplicationSceneManifest": {
+        "UISceneConfigurations": {
+            "UIWindowSceneSessionRoleApplication": [
+                {"UISceneDelegateClassName": "SceneDelegate", "UISceneConfigurationName": "Default"}
+            ]
+        }
+    },
+}
+
+LOCALIZABLE_STRINGS = """/* 인사 */
+"greeting_title" = "Hello";
+"settings.title" = "Settings";
+"%d items" = "%d items";
+"""
+
+
+def _make_project(root: Path) -> Path:
+    """종류별 리소스 파일을 하나씩 가진 작은 프로젝트 생성"""
+    app = root / "SampleApp"
+    (app / "Base.lproj").mkdir(parents=True)
+    (app / "Base.lproj" / "Main.storyboard").write_text(STORYBOARD, encoding="utf-8")
+    (app / "Base.lproj" / "Localizable.strings").write_text(LOCALIZABLE_STRINGS, encoding="utf-8")
+    (app / "ProfileHeaderView.xib").write_text(XIB, encoding="utf-8")
+    (app / "Broken.xib").write_text('<document><view customClass="Truncated', encoding="utf-8")
+    (app / "SampleApp.entitlements").write_text(ENTITLEMENTS, encoding="utf-8")
+    with open(app / "Info.plist", "wb") as f:
+        plistlib.dump(INFO_PLIST, f)
+    with open(app / "Extension.plist", "wb") as f:
+        plistlib.dump({"NSExtensionPrincipalClass": "ShareViewController"}, f, fmt=plistlib.FMT_BINARY)
+
+    model = app / "Model.xcdatamodeld" / "Model.xcdatamodel"
+    model.mkdir(parents=True)
+    (model / "contents").write_text(COREDATA_CONTENTS, encoding="utf-8")
+
+    assets = app / "Assets.xcassets"
+    for item in ("AppLogo.imageset", "BrandTint.colorset", "Onboarding.dataset", "custom.star.symbolset"):
+        (assets / item).mkdir(parents=True)
+    (assets / "AppLogo.imageset" / "Contents.json").write_text(
+        json.dumps({"images": [{"filename": "app-logo@2x.png", "scale": "2x"}]}), encoding="utf-8"
+    )
+
+    # 제외 디렉터리 안의 리소스는 스캔하지 않음
+    (root / "Pods" / "Vendor").mkdir(parents=True)
+    (root / "Pods" / "Vendor" / "Vendor.xib").write_text(XIB.replace("ProfileHeaderView", "VendorView"),
+                                                          encoding="utf-8")
+    return root
+
+
+# 위 프로젝트의 스캔 결과 (file_type → category → 식별자)
+EXPECTED_SCAN = {
+    "Assets": {
+        "asset_files": {"app-logo@2x"},
+        "colors": {"BrandTint"},
+        "data_assets": {"Onboarding"},
+        "images": {"AppLogo"},
+        "symbols": {"custom.star"},
+    },
+    "CoreData": {
+        "attributes": {"fullName", "id"},
+        "entities": {"Person"},
+        "fetch_requests": {"AllPeople"},
+        "relationships": {"friends"},
+    },
+    "Entitlements": {
+        "app_groups": {"$(TeamID).shared", "group.com.example.app"},
+        "associated_domains": {"applinks:example.com"},
+        "keychain_groups": {"$(AppIdentifierPrefix)com.example.app"},
+        "ubiquity_kvstore": {"$(TeamIdentifierPrefix)kvstore"},
+    },
+    "Plist": {
+        "bundle_identifiers": {"com.example.app"},
+        "principal_classes": {"SampleApplication", "SceneDelegate", "ShareViewController"},
+        "user_activity_types": {"com.example.app.browse"},
+    },
+    "Strings": {
+        "localization_keys": {"greeting_title", "settings.title"},
+    },
+    "XIB/Storyboard": {
+        "actions": {"bad selector", "closeTapped:"},
+        "classes": {"HomeViewController", "ItemCell", "ProfileHeaderView"},
+        "image_names": {"icon_close", "placeholder-photo"},
+        "modules": {"SampleApp"},
+        "outlets": {"closeButton"},
+        "restoration_identifiers": {"HomeRestore"},
+        "reuse_identifiers": {"ItemCell"},
+        "runtime_attributes": {"cornerRadius", "layer"},
+        "scene_labels": {"Home"},
+        "segue_identifiers": {"showDetail"},
+        "storyboard_identifiers": {"HomeScene"},
+        "system_symbols": {"xmark"},
+    },
+}
+
+
+def _scan(project: Path, jobs: int = 1):
+    scanner = ResourceScanner(project)
+    scanner.scan_all(jobs)
+    return {
+        file_type: {category: ids for category, ids in categories.items() if ids}
+        for file_type, categories in scanner.results.items()
+        if any(categories.values())
+    }
+
+
+def test_scan_fixture_project(tmp_path):
+    """iterparse 로 바꾼 뒤에도 파일 종류별 추출 결과가 이전과 동일 (깨진 XIB 는 건너뛰고, Pods 는 제외)"""
+    assert _scan(_make_project(tmp_path)) == EXPECTED_SCAN
+
+
+def test_parallel_scan_matches_sequential(tmp_path):
+    """jobs > 1 의 프로세스 풀 파싱도 순차 실행과 같은 결과"""
+    project = _make_project(tmp_path)
+
+    assert _scan(project, jobs=2) == _scan(project)
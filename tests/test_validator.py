@@ -0,0 +1,66 @@
+# tests/test_validator.py
+
+import json
+
+import validator
+
+
+class _FixedMatcher:
+    """규칙과 무관하게 정해진 노드 ID를 반환하는 매처"""
+
+    matches = set()
+
+    def __init__(self, symbol_graph):
+        self.symbol_graph = symbol_graph
+
+    def find_matches(self, rules):
+        return set(self.matches)
+
+
+def test_edge_only_nodes_are_not_predicted(tmp_path, monkeypatch):
+    """속성 없이 엣지로만 생긴 노드는 예측 심볼에 포함하지 않음"""
+    graph_path = tmp_path / "symbol_graph.json"
+    graph_path.write_text(json.dumps({
+        "symbols": [
+            {"id": "s1", "name": "AppDelegate", "kind": "class"},
+            {"id": "s2", "name": "viewDidLoad", "kind": "method"},
+        ],
+        "edges": [
+            {"from": "s1", "to": "UIApplicationDelegate", "type": "CONFORMS_TO"},
+        ],
+    }), encoding="utf-8")
+
+    monkeypatch.setattr(_FixedMatcher, "matches", {"s1", "UIApplicationDelegate"})
+    monkeypatch.setattr(validator, "PatternMatcher", _FixedMatcher)
+
+    result = validator.RuleValidator()._validate_single_project(
+        "sample", [], graph_path, {"AppDelegate"}
+    )
+
+    assert result["total_symbols"] == 3
+    assert result["predicted_count"] == 1
+    assert result["false_positive"] == 0
+    assert result["precision"] == 1.0
+
+
+def test_unreadable_ground_truth_skips_only_that_project(tmp_path, monkeypatch):
+    """정답 파일을 읽을 수 없으면 해당 프로젝트만 건너뜀"""
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text("rules: []\n", encoding="utf-8")
+
+    benchmark_dir = tmp_path / "rule_base"
+    benchmark_dir.mkdir()
+    (benchmark_dir / "life.txt").write_bytes(b"\xff\xfe\x00broken")
+    (benchmark_dir / "uikit1.txt").mkdir()
+    (benchmark_dir / "social.txt").write_text("AppDelegate\n", encoding="utf-8")
+
+    seen = []
+
+    def fake_validate(self, project_name, rules, symbol_graph_path, ground_truth):
+        seen.append(project_name)
+        return None
+
+    monkeypatch.setattr(validator.RuleValidator, "_validate_single_project", fake_validate)
+
+    assert validator.RuleValidator().validate_against_benchmark(rules_path, benchmark_dir) == {}
+    assert seen == ["social"]